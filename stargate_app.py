@@ -6,22 +6,34 @@ Run:
 
 from __future__ import annotations
 
+import atexit
 import json
 import math
+import queue
 import random
 import sys
+import threading
+import time
 import traceback
-from array import array
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pygame
+import pygame.gfxdraw
 
 
 WINDOW_SIZE = (1500, 920)
 FPS = 60
+# Frame rate once the app has sat in IDLE without input for IDLE_THROTTLE_MS; the stars
+# and nebulas drift slowly enough that half rate is indistinguishable.
+IDLE_FPS = 30
+IDLE_THROTTLE_MS = 3000
+# Loop rate while the window is minimised in IDLE: nothing is drawn, only input and the
+# screensaver timer are polled.
+HIDDEN_FPS = 10
 SYMBOL_COUNT = 39
 MIN_ADDRESS_LENGTH = 7
 MAX_ADDRESS_LENGTH = 9
@@ -29,6 +41,8 @@ PANEL_WIDTH_RATIO = 0.31
 PANEL_WIDTH_MIN = 430
 PANEL_WIDTH_MAX = 560
 MAX_WORMHOLE_DURATION_SECONDS = 38 * 60
+# Thickness of the auto-close warning border once the countdown reaches zero.
+WARNING_BORDER_MAX = 14
 SYMBOL_ARC_DEG = 360.0 / SYMBOL_COUNT
 TOP_CHEVRON_ANGLE_DEG = -90.0
 DIAL_SPIN_BASE_SPEED = 90.0
@@ -37,14 +51,79 @@ DIAL_SPIN_SPEED_STEP = 6.0
 DIAL_MIN_TRAVEL_DEG = 360.0
 CHEVRON_ACTUATE_MS = 380
 NEXT_SYMBOL_DELAY_MS = 2000
-
-
-KNOWN_ADDRESSES: Dict[str, List[int]] = {
-    "Abydos": [26, 6, 14, 31, 11, 29, 1],
-    "Chulak": [8, 1, 22, 14, 36, 19, 4],
-    "Dakara": [17, 28, 4, 35, 9, 21, 2],
-    "Earth": [1, 11, 2, 19, 21, 24, 35],
+# Ring angle that brings each symbol under the top chevron, by symbol index.
+SYMBOL_ALIGNMENT_ANGLES: Tuple[float, ...] = tuple(
+    TOP_CHEVRON_ANGLE_DEG - i * SYMBOL_ARC_DEG for i in range(SYMBOL_COUNT)
+)
+# Ring spin speed (deg/s) for each dial step, before the dialing speed multiplier.
+DIAL_SPIN_SPEEDS: Tuple[float, ...] = tuple(
+    DIAL_SPIN_BASE_SPEED + min(110.0, i * DIAL_SPIN_SPEED_STEP) for i in range(MAX_ADDRESS_LENGTH)
+)
+# AppLogger severities; errors and crashes are always written.
+LOG_LEVELS: Dict[str, int] = {"INFO": 20, "WARN": 30, "ERROR": 40}
+# Seconds AppLogger's writer thread waits to batch lines before appending them to the log.
+LOG_FLUSH_INTERVAL = 0.1
+# Rendered text surfaces kept by StargateApp._text before the cache is reset.
+TEXT_CACHE_LIMIT = 256
+# Nebula glow is stepped by this much alpha so the cached sky layer is recomposed a few
+# times per second instead of every frame; a step this small is below one colour level.
+NEBULA_GLOW_STEP = 3
+# Brightness steps of the pulsing ring glyphs (active symbol, point of origin), so each
+# glyph cycles through a fixed set of cached renders instead of a new colour per frame.
+RING_PULSE_LEVELS = 16
+# Strength steps of the actuating chevron's tip glow, which is cached per strength.
+CHEVRON_GLOW_LEVELS = 8
+# Scaled copies of the reference DHD image kept for quick window-resize round trips.
+REFERENCE_SCALE_CACHE_LIMIT = 8
+# Gate glyph fonts kept by pixel size, for the same reason.
+GATE_GLYPH_FONT_CACHE_LIMIT = 8
+# DHD artwork files in order of preference; the first that decodes is used.
+DHD_REFERENCE_FILES = ("dhd_original.png", "dhd_symbols.png", "dhd_reference.png")
+# DHD symbol rings: 27 outer and 12 inner equal sectors; the inner ring is offset by half a sector.
+DHD_OUTER_COUNT = 27
+DHD_OUTER_STEP = 360.0 / DHD_OUTER_COUNT
+DHD_INNER_COUNT = 12
+DHD_INNER_STEP = 360.0 / DHD_INNER_COUNT
+DHD_INNER_OFFSET = DHD_INNER_STEP * 0.5
+# Sectors per radian of atan2 output, so hit-testing never converts to degrees.
+DHD_OUTER_PER_RADIAN = DHD_OUTER_COUNT / math.tau
+DHD_INNER_PER_RADIAN = DHD_INNER_COUNT / math.tau
+# Arc segments per sector edge. Six chords keep the sagitta under half a pixel on
+# the 30-degree inner sectors at any DHD size that fits on screen.
+DHD_SECTOR_STEPS = 6
+# Brightness steps of the reference DHD's pulsing centre button.
+DHD_GLOW_LEVELS = 16
+# Transparent colour of the cached procedural DHD layer; never used by the DHD itself.
+PROCEDURAL_LAYER_KEY = (255, 0, 255)
+# Sector angles (degrees, clockwise from 12 o'clock) by symbol index: outer ring first, then inner.
+DHD_SECTOR_START = np.concatenate([
+    (np.arange(DHD_OUTER_COUNT) * DHD_OUTER_STEP) % 360.0,
+    (DHD_INNER_OFFSET + np.arange(DHD_INNER_COUNT) * DHD_INNER_STEP) % 360.0,
+])
+DHD_SECTOR_END = (
+    DHD_SECTOR_START + np.repeat([DHD_OUTER_STEP, DHD_INNER_STEP], [DHD_OUTER_COUNT, DHD_INNER_COUNT])
+) % 360.0
+# Trig tables for the fixed sector angles, so a resize only scales them by the new radii:
+# each sector's arc vertices (DHD_SECTOR_STEPS + 1 per row) and its mid-angle.
+_DHD_SECTOR_SWEEP = (DHD_SECTOR_END - DHD_SECTOR_START) % 360.0
+_DHD_ARC_RAD = np.radians(
+    (DHD_SECTOR_START[:, None] + _DHD_SECTOR_SWEEP[:, None] * (np.arange(DHD_SECTOR_STEPS + 1) / DHD_SECTOR_STEPS)) % 360.0
+)
+DHD_ARC_SIN = np.sin(_DHD_ARC_RAD)
+DHD_ARC_COS = np.cos(_DHD_ARC_RAD)
+_DHD_MID_RAD = np.radians((DHD_SECTOR_START + _DHD_SECTOR_SWEEP * 0.5) % 360.0)
+DHD_MID_SIN = np.sin(_DHD_MID_RAD)
+DHD_MID_COS = np.cos(_DHD_MID_RAD)
+
+
+KNOWN_ADDRESSES: Dict[str, Tuple[int, ...]] = {
+    "Abydos": (26, 6, 14, 31, 11, 29, 1),
+    "Chulak": (8, 1, 22, 14, 36, 19, 4),
+    "Dakara": (17, 28, 4, 35, 9, 21, 2),
+    "Earth": (1, 11, 2, 19, 21, 24, 35),
 }
+# Reverse lookup so a dialled address resolves to its destination in one hash probe.
+KNOWN_ADDRESS_NAMES: Dict[Tuple[int, ...], str] = {addr: name for name, addr in KNOWN_ADDRESSES.items()}
 
 # Flavour text shown in the destination info panel for known addresses.
 DESTINATION_INFO: Dict[str, Dict[str, str]] = {
@@ -83,15 +162,54 @@ DIAL_FAIL_CHANCE = 0.35
 # How long the failure flash persists (ms).
 DIAL_FAIL_FLASH_MS = 1800
 
+# Key hints at the foot of the console, above the control buttons.
+CONSOLE_HINTS = (
+    "Center = DIAL  |  I: Iris  |  Tab: Dial Log",
+    "1-9: symbols  |  F1-F4: presets  |  IDC code: 314",
+    "Enter: DIAL | Backspace: BACK | Del: CLEAR | Esc: CLOSE",
+)
+
 # Lock order for 9 chevrons (index = gate chevron position, 0 = top/12 o'clock).
 # In SG-1, chevron 7 (top, index 0) locks last for a 7-symbol address, with
 # the right/bottom/left filling in first — matching the show's dramatic finale.
 CHEVRON_LOCK_ORDER = [2, 3, 4, 5, 6, 8, 0, 1, 7]
+# Lit chevron positions after n locks, by n.
+CHEVRON_LOCKED_SETS = tuple(frozenset(CHEVRON_LOCK_ORDER[:n]) for n in range(len(CHEVRON_LOCK_ORDER) + 1))
+# Outward unit vector (cos, sin) of each chevron position, clockwise from the top.
+CHEVRON_DIRECTIONS: Tuple[Tuple[float, float], ...] = tuple(
+    (math.cos(math.radians(-90 + i * (360 / 9))), math.sin(math.radians(-90 + i * (360 / 9)))) for i in range(9)
+)
 
 ASCII_GLYPH_CHARS = list("ABCDEFGHIJKLMNOPQRSTUVWXYZ") + list("abcdefghijklm")
 FONT_GLYPH_CHARS = [chr(0xF101 + i) for i in range(SYMBOL_COUNT)]
 GLYPH_CHARS = ASCII_GLYPH_CHARS
 
+# One period of a sine wave shared by all synthesised sounds; indexed by phase.
+SINE_TABLE_SIZE = 4096
+# Bump when synthesis changes so stale cached PCM in <runtime>/cache is ignored.
+SYNTH_CACHE_VERSION = 3
+# Per-sound mix levels before the user's master/ambient volume scale.
+SOUND_VOLUMES: Dict[str, float] = {
+    "press": 0.58,
+    "engage": 0.74,
+    "ring": 0.16,
+    "lock": 0.76,
+    "error": 0.70,
+    "close": 0.70,
+    "kawoosh": 0.95,
+    "connected": 0.72,
+}
+# Sounds whose source file is written to the log at startup and once decoding finishes.
+LOGGED_SOUNDS = ("press", "engage", "ring", "lock", "kawoosh", "close", "connected")
+# Default mixer buffer in samples (settings "audio_buffer"): 256 (~6 ms) keeps
+# button/lock sounds responsive; 512 is the fallback for audio devices that refuse
+# the configured buffer.
+MIXER_BUFFER = 256
+MIXER_FALLBACK_BUFFER = 512
+# Angles of the six outer-rim vertices of an iris petal, relative to its centre line.
+IRIS_ARC_OFFSETS = np.radians(np.linspace(-14.0, 14.0, 6))
+_SINE_TABLE = np.sin(np.arange(SINE_TABLE_SIZE) * (2 * np.pi / SINE_TABLE_SIZE)).astype(np.float32)
+
 
 @dataclass
 class Button:
@@ -101,24 +219,22 @@ class Button:
     payload: int | str | None = None
 
 
-@dataclass
-class DHDSector:
-    index: int
-    start_angle: float
-    end_angle: float
-    inner_radius: float
-    outer_radius: float
-
+def _circle_offsets(radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    """x and y offsets of the pixels pygame.draw.circle covers at the given radius, relative to its centre."""
+    size = radius * 2 + 3
+    stamp = pygame.Surface((size, size))
+    pygame.draw.circle(stamp, (255, 255, 255), (radius + 1, radius + 1), radius)
+    dx, dy = np.nonzero(pygame.surfarray.array_red(stamp))
+    return (dx - (radius + 1)).astype(np.int32), (dy - (radius + 1)).astype(np.int32)
 
-def _cw_angle_from_vector(dx: float, dy: float) -> float:
-    """Return angle where 0 is up and positive is clockwise."""
-    return math.degrees(math.atan2(dx, -dy)) % 360.0
 
-
-def _angle_in_span(angle: float, start: float, end: float) -> bool:
-    if start <= end:
-        return start <= angle < end
-    return angle >= start or angle < end
+def _sine_lookup(cycles: np.ndarray) -> np.ndarray:
+    """Sample the shared sine table at phases given in cycles, or directly at integer table indices."""
+    if cycles.dtype.kind == "f":
+        idx = (cycles * SINE_TABLE_SIZE).astype(np.int32) & (SINE_TABLE_SIZE - 1)
+    else:
+        idx = cycles & (SINE_TABLE_SIZE - 1)
+    return _SINE_TABLE[idx]
 
 
 DEFAULT_SETTINGS: Dict[str, Any] = {
@@ -131,6 +247,8 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
     "idc_code": "314",
     "screensaver_idle_seconds": 60,
     "sound_pack_dir": "",              # empty = use assets/sounds
+    "audio_buffer": MIXER_BUFFER,      # samples; raise to 1024-2048 if audio crackles under load
+    "log_level": "INFO",               # INFO, WARN or ERROR
 }
 
 
@@ -178,6 +296,19 @@ def _asset_dir() -> Path:
     return script_dir / "assets"
 
 
+def _decode_reference_image(assets: Path) -> Optional[pygame.Surface]:
+    """Decode the DHD artwork without converting it, so this may run off the main thread."""
+    for name in DHD_REFERENCE_FILES:
+        path = assets / name
+        if not path.exists():
+            continue
+        try:
+            return pygame.image.load(str(path))
+        except pygame.error:
+            continue
+    return None
+
+
 def _runtime_dir() -> Path:
     if getattr(sys, "frozen", False):
         return Path(sys.executable).resolve().parent
@@ -193,6 +324,19 @@ class AppLogger:
         stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_path = self.log_dir / f"stargate_app_{stamp}.log"
         self.max_bytes = 2_000_000
+        # Lowest level written; info()/warning() below it return before formatting anything.
+        self.level = LOG_LEVELS["INFO"]
+        # Bytes in the current log file, tracked as lines are appended instead of stat()ing it.
+        self._current_size = self.log_path.stat().st_size if self.log_path.exists() else 0
+        # Lines are queued by _write and appended in batches by a background thread,
+        # so the frame loop never waits on the file system.
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._wake = threading.Event()
+        self._io_lock = threading.Lock()
+        # Kept open between batches; reopened after a rollover or a failed write.
+        self._file: Optional[IO[str]] = None
+        threading.Thread(target=self._drain, name="AppLogger", daemon=True).start()
+        atexit.register(self.close)
         self._write("INFO", "Logger initialized", {"log_path": str(self.log_path)})
         self.install_excepthook()
 
@@ -202,40 +346,84 @@ class AppLogger:
         def _hook(exc_type, exc_value, exc_tb):  # type: ignore[no-untyped-def]
             details = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
             self._write("CRITICAL", "Unhandled exception", {"traceback": details.strip()})
+            self.flush()
             old_hook(exc_type, exc_value, exc_tb)
 
         sys.excepthook = _hook
 
     def _rollover_if_needed(self) -> None:
-        if not self.log_path.exists():
-            return
-        if self.log_path.stat().st_size < self.max_bytes:
+        if self._current_size < self.max_bytes:
             return
         stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_path = self.log_dir / f"stargate_app_{stamp}.log"
+        self._current_size = 0
+        self._close_file()
 
-    def _write(self, level: str, message: str, details: Optional[Dict[str, str]] = None) -> None:
-        self._rollover_if_needed()
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"{ts} [{level}] {message}"
-        if details:
-            safe_details = {k: str(v).replace("\n", "\\n") for k, v in details.items()}
-            joined = " | ".join(f"{k}={v}" for k, v in safe_details.items())
-            line = f"{line} | {joined}"
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
         try:
-            with self.log_path.open("a", encoding="utf-8") as f:
-                f.write(line + "\n")
+            self._file.close()
         except OSError:
             pass
+        self._file = None
+
+    def _write(self, level: str, message: str, details: Optional[Dict[str, object]] = None) -> None:
+        # One join over the pieces; each detail value is stringified (and kept on one line) here only.
+        parts = [datetime.now().strftime("%Y-%m-%d %H:%M:%S"), " [", level, "] ", message]
+        if details:
+            for key, value in details.items():
+                parts += (" | ", key, "=", str(value).replace("\n", "\\n"))
+        self._queue.put("".join(parts))
+        self._wake.set()
+
+    def _drain(self) -> None:
+        while True:
+            self._wake.wait()
+            time.sleep(LOG_FLUSH_INTERVAL)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Append every queued line to the log file in one write."""
+        with self._io_lock:
+            lines: List[str] = []
+            while True:
+                try:
+                    lines.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not lines:
+                return
+            self._rollover_if_needed()
+            text = "\n".join(lines) + "\n"
+            try:
+                if self._file is None:
+                    self._file = self.log_path.open("a", encoding="utf-8")
+                self._file.write(text)
+                self._file.flush()
+            except OSError:
+                self._close_file()
+                return
+            self._current_size += len(text.encode("utf-8"))
+
+    def close(self) -> None:
+        self.flush()
+        with self._io_lock:
+            self._close_file()
 
     def info(self, message: str, **details: object) -> None:
-        self._write("INFO", message, {k: str(v) for k, v in details.items()})
+        if self.level > LOG_LEVELS["INFO"]:
+            return
+        self._write("INFO", message, details)
 
     def warning(self, message: str, **details: object) -> None:
-        self._write("WARN", message, {k: str(v) for k, v in details.items()})
+        if self.level > LOG_LEVELS["WARN"]:
+            return
+        self._write("WARN", message, details)
 
     def error(self, message: str, **details: object) -> None:
-        self._write("ERROR", message, {k: str(v) for k, v in details.items()})
+        self._write("ERROR", message, details)
 
     def exception(self, message: str, exc: BaseException) -> None:
         tb = traceback.format_exc().strip()
@@ -247,24 +435,48 @@ class AppLogger:
                 "traceback": tb,
             },
         )
+        # Failures usually end the run; get the traceback on disk before anything else.
+        self.flush()
 
 
 class GateAudio:
-    def __init__(self, assets: Path) -> None:
+    def __init__(self, assets: Path, cache_dir: Optional[Path] = None) -> None:
         self.enabled = False
+        self.cache_dir = cache_dir
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        # Sound files found on disk but not decoded yet; see _sound() and preload_next().
+        self._pending: Dict[str, List[Path]] = {}
+        self.master_volume = 1.0
+        self.ambient_volume = 1.0
         self.loop_channel: Optional[pygame.mixer.Channel] = None
+        self.effect_channels: Dict[str, pygame.mixer.Channel] = {}
+        # Decoded sound and its reserved channel (if any) per name, resolved once for play().
+        self._effects: Dict[str, Tuple[pygame.mixer.Sound, Optional[pygame.mixer.Channel]]] = {}
         self.loaded_from: Dict[str, str] = {}
 
-        try:
-            pygame.mixer.pre_init(44100, -16, 1, 512)
-            pygame.mixer.init()
-        except pygame.error:
-            return
+        # pygame.init() normally opens the mixer with the pre_init() settings from
+        # StargateApp; only fall back to a larger buffer if that failed.
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init(44100, -16, 1, MIXER_FALLBACK_BUFFER, allowedchanges=0)
+            except pygame.error:
+                return
 
         self.enabled = True
-        self.loop_channel = pygame.mixer.Channel(1)
-        self.ambient_channel = pygame.mixer.Channel(2)
+        # Reserved channels are never picked by Sound.play(), so one-shot effects can no
+        # longer land on (and then be cut off by) the loop or ambient channel. Press, lock
+        # and kawoosh get their own voice; a repeat restarts it instead of stacking.
+        # Channel map: 0 ring loop, 1 ambient hum, 2 press, 3 lock, 4 kawoosh (all reserved);
+        # 5-9 are left to Sound.play() for the other one-shot effects.
+        pygame.mixer.set_num_channels(10)
+        pygame.mixer.set_reserved(5)
+        self.loop_channel = pygame.mixer.Channel(0)
+        self.ambient_channel = pygame.mixer.Channel(1)
+        self.effect_channels = {
+            "press": pygame.mixer.Channel(2),
+            "lock": pygame.mixer.Channel(3),
+            "kawoosh": pygame.mixer.Channel(4),
+        }
         sound_dir = assets / "sounds"
         sound_map = {
             "press": [
@@ -284,111 +496,196 @@ class GateAudio:
             "connected": ["sequence_complete.mp3", "event_horizon.mp3"],
         }
 
+        # Only locate files here; decoding is deferred so startup stays fast.
         for key, filenames in sound_map.items():
-            for filename in filenames:
-                path = sound_dir / filename
-                if path.exists():
-                    try:
-                        self.sounds[key] = pygame.mixer.Sound(str(path))
-                        self.loaded_from[key] = str(path.name)
-                        break
-                    except pygame.error:
-                        continue
-
-        # Synth fallback so app still works without external assets.
-        if "press" not in self.sounds:
-            self.sounds["press"] = self._tone(630, 0.06, 0.18)
-            self.loaded_from["press"] = "synth_tone"
-        if "engage" not in self.sounds:
-            self.sounds["engage"] = self._tone(400, 0.20, 0.22)
-            self.loaded_from["engage"] = "synth_tone"
-        if "ring" not in self.sounds:
-            self.sounds["ring"] = self._tone(300, 0.25, 0.08)
-            self.loaded_from["ring"] = "synth_tone"
-        if "lock" not in self.sounds:
-            self.sounds["lock"] = self._tone(520, 0.15, 0.23)
-            self.loaded_from["lock"] = "synth_tone"
-        if "error" not in self.sounds:
-            self.sounds["error"] = self._tone(220, 0.20, 0.22)
-            self.loaded_from["error"] = "synth_tone"
-        if "close" not in self.sounds:
-            self.sounds["close"] = self._tone(170, 0.32, 0.22)
-            self.loaded_from["close"] = "synth_tone"
-        if "kawoosh" not in self.sounds:
-            self.sounds["kawoosh"] = self._sweep(170, 900, 0.9, 0.28)
-            self.loaded_from["kawoosh"] = "synth_sweep"
-        if "connected" not in self.sounds:
-            self.sounds["connected"] = self._tone(760, 0.22, 0.20)
-            self.loaded_from["connected"] = "synth_tone"
+            paths = [sound_dir / filename for filename in filenames if (sound_dir / filename).exists()]
+            if paths:
+                self._pending[key] = paths
+            else:
+                self._add_synth_fallback(key)
+        # Set while files are still waiting to be decoded; cleared once preload_next() reports them all.
+        self._decoding = bool(self._pending)
+
         # Ambient hum: two detuned sine waves that beat against each other,
         # giving a low mechanical rumble. Always synthesised.
-        self.sounds["ambient_idle"] = self._hum(55, 58, 3.0, 0.08)
-        self.loaded_from["ambient_idle"] = "synth_hum"
-        self.sounds["ambient_active"] = self._hum(80, 84, 3.0, 0.14)
-        self.loaded_from["ambient_active"] = "synth_hum"
-
-        volumes = {
-            "press": 0.58,
-            "engage": 0.74,
-            "ring": 0.16,
-            "lock": 0.76,
-            "error": 0.70,
-            "close": 0.70,
-            "kawoosh": 0.95,
-            "connected": 0.72,
+        self._add_sound("ambient_idle", self._hum(55, 58, 3.0, 0.08), "synth_hum")
+        self._add_sound("ambient_active", self._hum(80, 84, 3.0, 0.14), "synth_hum")
+
+    def _add_sound(self, key: str, snd: pygame.mixer.Sound, source: str) -> None:
+        self.sounds[key] = snd
+        self._effects[key] = (snd, self.effect_channels.get(key))
+        self.loaded_from[key] = source
+        self._apply_volume(key, snd)
+
+    def _add_synth_fallback(self, key: str) -> None:
+        """Synth fallback so app still works without external assets."""
+        if key == "kawoosh":
+            self._add_sound(key, self._sweep(170, 900, 0.9, 0.28), "synth_sweep")
+            return
+        tones = {
+            "press": (630, 0.06, 0.18),
+            "engage": (400, 0.20, 0.22),
+            "ring": (300, 0.25, 0.08),
+            "lock": (520, 0.15, 0.23),
+            "error": (220, 0.20, 0.22),
+            "close": (170, 0.32, 0.22),
+            "connected": (760, 0.22, 0.20),
         }
+        if key in tones:
+            self._add_sound(key, self._tone(*tones[key]), "synth_tone")
+
+    def _apply_volume(self, key: str, snd: pygame.mixer.Sound) -> None:
+        scale = self.master_volume * (self.ambient_volume if key.startswith("ambient") else 1.0)
+        snd.set_volume(min(1.0, SOUND_VOLUMES.get(key, 0.70) * scale))
+
+    def set_volume_scale(self, master: float, ambient: float) -> None:
+        """Apply user volume settings to loaded sounds and any decoded later."""
+        self.master_volume = master
+        self.ambient_volume = ambient
         for key, snd in self.sounds.items():
-            snd.set_volume(volumes.get(key, 0.70))
+            self._apply_volume(key, snd)
+
+    def _sound(self, name: str) -> Optional[pygame.mixer.Sound]:
+        """Return a sound, decoding its file on first use."""
+        snd = self.sounds.get(name)
+        if snd or name not in self._pending:
+            return snd
+        for path in self._pending.pop(name):
+            try:
+                self._add_sound(name, pygame.mixer.Sound(str(path)), str(path.name))
+                break
+            except pygame.error:
+                continue
+        else:
+            self._add_synth_fallback(name)
+        return self.sounds.get(name)
+
+    def preload_next(self) -> bool:
+        """Decode one pending sound file; called once per frame so files load in the background.
+
+        Returns True once, on the call after which every file has been decoded (or replaced by a fallback).
+        """
+        if self._pending:
+            self._sound(next(iter(self._pending)))
+        if self._pending or not self._decoding:
+            return False
+        self._decoding = False
+        return True
+
+    def sources(self, keys: Tuple[str, ...]) -> Dict[str, str]:
+        """Where each sound came from, "pending" while its file is not decoded yet."""
+        return {
+            key: self.loaded_from.get(key, "pending" if key in self._pending else "missing") for key in keys
+        }
+
+    def _load_cached_sound(self, key: str, frame_count: int) -> Optional[pygame.mixer.Sound]:
+        if not self.cache_dir:
+            return None
+        # A missing file is the common first-run case; one read attempt covers it without a stat.
+        try:
+            pcm = (self.cache_dir / f"{key}_v{SYNTH_CACHE_VERSION}.pcm").read_bytes()
+        except OSError:
+            return None
+        # Sound(buffer=...) accepts empty or truncated data; treat those as a miss and re-synthesise.
+        if len(pcm) != frame_count * 2:
+            return None
+        try:
+            return pygame.mixer.Sound(buffer=pcm)
+        except pygame.error:
+            return None
+
+    def _store_cached_sound(self, key: str, pcm: np.ndarray) -> pygame.mixer.Sound:
+        # The int16 array is handed over through the buffer protocol; no bytes copy.
+        if self.cache_dir:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                # Write beside the target and swap it in, so an interrupted write never leaves a short file.
+                path = self.cache_dir / f"{key}_v{SYNTH_CACHE_VERSION}.pcm"
+                partial = path.with_suffix(".tmp")
+                partial.write_bytes(pcm)
+                partial.replace(path)
+            except OSError:
+                pass
+        return pygame.mixer.Sound(buffer=pcm)
 
     def _tone(self, freq: float, seconds: float, volume: float) -> pygame.mixer.Sound:
+        key = f"tone_{freq}_{seconds}_{volume}"
         sample_rate = 44100
         frame_count = int(sample_rate * seconds)
-        pcm = array("h")
-        for i in range(frame_count):
-            t = i / sample_rate
-            sample = math.sin(2 * math.pi * freq * t)
-            pcm.append(int(sample * 32767 * volume))
-        return pygame.mixer.Sound(buffer=pcm)
+        cached = self._load_cached_sound(key, frame_count)
+        if cached is not None:
+            return cached
+        # 16.16 fixed-point phase accumulator: integer-only table indices at the exact pitch.
+        # The table index only needs the low 12 + 16 bits, so uint32 wrap-around is harmless
+        # and halves the working set compared with int64.
+        step = int(round(freq * SINE_TABLE_SIZE * 65536 / sample_rate))
+        idx = (np.arange(frame_count, dtype=np.uint32) * np.uint32(step)) >> np.uint32(16)
+        return self._synth(key, idx, None, 32767 * volume)
 
     def _hum(self, freq1: float, freq2: float, seconds: float, volume: float) -> pygame.mixer.Sound:
         """Two detuned sines layered to create a beating mechanical hum."""
+        key = f"hum_{freq1}_{freq2}_{seconds}_{volume}"
         sample_rate = 44100
         frame_count = int(sample_rate * seconds)
-        pcm = array("h")
-        for i in range(frame_count):
-            t = i / sample_rate
-            s = math.sin(2 * math.pi * freq1 * t) + math.sin(2 * math.pi * freq2 * t)
-            # Fade in/out over first/last 0.1 s to avoid clicks when looping.
-            env = min(1.0, t / 0.1) * min(1.0, (seconds - t) / 0.1)
-            pcm.append(int(s * 0.5 * 32767 * volume * env))
-        return pygame.mixer.Sound(buffer=pcm)
+        cached = self._load_cached_sound(key, frame_count)
+        if cached is not None:
+            return cached
+        t = np.arange(frame_count, dtype=np.float32) / np.float32(sample_rate)
+        # Fade in/out over first/last 0.1 s to avoid clicks when looping.
+        env = np.minimum(1.0, t / 0.1) * np.minimum(1.0, (seconds - t) / 0.1)
+        return self._synth(key, np.stack([t * freq1, t * freq2]), env, 0.5 * 32767 * volume)
 
     def _sweep(
         self, start_freq: float, end_freq: float, seconds: float, volume: float
     ) -> pygame.mixer.Sound:
+        key = f"sweep_{start_freq}_{end_freq}_{seconds}_{volume}"
         sample_rate = 44100
         frame_count = int(sample_rate * seconds)
-        pcm = array("h")
-        for i in range(frame_count):
-            blend = i / max(1, frame_count - 1)
-            freq = start_freq + (end_freq - start_freq) * blend
-            t = i / sample_rate
-            sample = math.sin(2 * math.pi * freq * t)
-            envelope = min(1.0, blend * 4.0) * max(0.0, 1.0 - blend * 0.7)
-            pcm.append(int(sample * 32767 * volume * envelope))
-        return pygame.mixer.Sound(buffer=pcm)
+        cached = self._load_cached_sound(key, frame_count)
+        if cached is not None:
+            return cached
+        n = np.arange(frame_count, dtype=np.float64)
+        span = max(1, frame_count - 1)
+        blend = (n / span).astype(np.float32)
+        # A linear chirp's phase integral is quadratic in n, so there is no need for a
+        # sequential cumsum (and its float32 drift over tens of thousands of samples).
+        cycles = (start_freq * n + (end_freq - start_freq) * n * n / (2 * span)) / sample_rate
+        envelope = np.minimum(1.0, blend * 4.0) * np.maximum(0.0, 1.0 - blend * 0.7)
+        return self._synth(key, cycles, envelope, 32767 * volume)
+
+    def _synth(
+        self, key: str, cycles: np.ndarray, envelope: Optional[np.ndarray], gain: float
+    ) -> pygame.mixer.Sound:
+        """Shared oscillator -> envelope -> int16 stage; a 2-D cycles array sums one sine per row."""
+        # Everything stays float32 (the table's dtype); int16 output needs no more precision.
+        wave = _sine_lookup(cycles)
+        if wave.ndim > 1:
+            wave = wave.sum(axis=0, dtype=np.float32)
+        if envelope is not None:
+            wave *= envelope.astype(np.float32, copy=False)
+        wave *= np.float32(gain)
+        # Clip before the cast so an overdriven mix saturates instead of wrapping around.
+        np.clip(wave, -32768, 32767, out=wave)
+        return self._store_cached_sound(key, wave.astype(np.int16))
 
     def play(self, name: str) -> None:
         if not self.enabled:
             return
-        snd = self.sounds.get(name)
-        if snd:
+        effect = self._effects.get(name)
+        if effect is None:
+            if not self._sound(name):
+                return
+            effect = self._effects[name]
+        snd, channel = effect
+        if channel:
+            channel.play(snd)
+        else:
             snd.play()
 
     def start_loop(self, name: str) -> None:
         if not self.enabled or not self.loop_channel:
             return
-        snd = self.sounds.get(name)
+        snd = self._sound(name)
         if not snd:
             return
         self.loop_channel.stop()
@@ -401,7 +698,7 @@ class GateAudio:
     def start_ambient(self, name: str) -> None:
         if not self.enabled or not self.ambient_channel:
             return
-        snd = self.sounds.get(name)
+        snd = self._sound(name)
         if snd:
             self.ambient_channel.stop()
             self.ambient_channel.play(snd, loops=-1)
@@ -412,7 +709,13 @@ class GateAudio:
 
 
 class DHDWheel:
-    def __init__(self, center: Tuple[int, int], assets: Path, font: pygame.font.Font) -> None:
+    def __init__(
+        self,
+        center: Tuple[int, int],
+        assets: Path,
+        font: pygame.font.Font,
+        reference: Optional[pygame.Surface] = None,
+    ) -> None:
         self.center = center
         self.font = font
 
@@ -422,26 +725,34 @@ class DHDWheel:
         self.inner_ring_inner = 120
         self.center_button_radius = 84
 
-        self.sectors: List[DHDSector] = []
+        # Sector outlines by symbol index, inset by 3 px (procedural fill, in _procedural_layer
+        # coordinates) and 4 px (reference highlight, in _overlay coordinates).
+        self._fill_outlines: List[List[Tuple[int, int]]] = []
+        self._overlay_outlines: List[List[Tuple[int, int]]] = []
+        # Procedural-style labels: rendered once here, positioned whenever the geometry changes.
+        self._glyph_surfaces = [
+            self.font.render(GLYPH_CHARS[i] if i < len(GLYPH_CHARS) else "?", True, (38, 42, 48)).convert_alpha()
+            for i in range(SYMBOL_COUNT)
+        ]
+        self._glyph_labels: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        self.sector_centers: List[Tuple[int, int]] = []
         self.reference_source: Optional[pygame.Surface] = None
+        # Scaled reference images by size, least recently used first.
+        self._scale_cache: Dict[int, pygame.Surface] = {}
         self.image_surface: Optional[pygame.Surface] = None
         self.image_rect: Optional[pygame.Rect] = None
-        self._load_reference_image(assets)
+        self._pedestal_surface: Optional[pygame.Surface] = None
+        self._pedestal_origin: Tuple[int, int] = (0, 0)
+        self._load_reference_image(assets, reference)
         self.set_geometry(center, 280)
 
-    def _load_reference_image(self, assets: Path) -> None:
-        filenames = ["dhd_original.png", "dhd_symbols.png", "dhd_reference.png"]
-        for name in filenames:
-            path = assets / name
-            if not path.exists():
-                continue
-            try:
-                source = pygame.image.load(str(path)).convert_alpha()
-            except pygame.error:
-                continue
-            self.reference_source = source
-            self._rescale_reference_image()
+    def _load_reference_image(self, assets: Path, decoded: Optional[pygame.Surface] = None) -> None:
+        if decoded is None:
+            decoded = _decode_reference_image(assets)
+        if decoded is None:
             return
+        self.reference_source = decoded.convert_alpha()
+        self._rescale_reference_image()
 
     def _rescale_reference_image(self) -> None:
         if not self.reference_source:
@@ -449,9 +760,40 @@ class DHDWheel:
             self.image_rect = None
             return
         size = self.outer_radius * 2 + 14
-        self.image_surface = pygame.transform.smoothscale(self.reference_source, (size, size))
+        # Resizing the window tends to revisit the same few sizes; keep recent scales.
+        scaled = self._scale_cache.pop(size, None)
+        if scaled is None:
+            scaled = pygame.transform.smoothscale(self.reference_source, (size, size)).convert_alpha()
+            if len(self._scale_cache) >= REFERENCE_SCALE_CACHE_LIMIT:
+                del self._scale_cache[next(iter(self._scale_cache))]
+        self._scale_cache[size] = scaled
+        self.image_surface = scaled
         self.image_rect = self.image_surface.get_rect(center=self.center)
 
+        # Grounding shadow under the reference image; only depends on the geometry.
+        shadow = pygame.Surface((self.image_rect.width + 40, self.image_rect.height + 40), pygame.SRCALPHA)
+        ellipse_rect = pygame.Rect(0, 0, int(self.outer_radius * 2.1), int(self.outer_radius * 0.48))
+        ellipse_rect.center = (shadow.get_width() // 2, int(shadow.get_height() * 0.72))
+        pygame.draw.ellipse(shadow, (0, 0, 0, 130), ellipse_rect)
+        pygame.draw.ellipse(shadow, (14, 26, 38, 70), ellipse_rect.inflate(-24, -10))
+        shadow_rect = shadow.get_rect(center=(self.center[0] + 10, self.center[1] + int(self.outer_radius * 0.66)))
+
+        # Shadow, back rim and wheel art are all static, so they are composited
+        # into one pedestal layer and drawn with a single blit per frame.
+        rim_center = (self.center[0] + 5, self.center[1] + 6)
+        rim_radius = self.outer_radius + 8
+        rim_rect = pygame.Rect(0, 0, rim_radius * 2 + 1, rim_radius * 2 + 1)
+        rim_rect.center = rim_center
+        bounds = shadow_rect.union(rim_rect).union(self.image_rect)
+        pedestal = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        pedestal.blit(shadow, shadow_rect.move(-bounds.x, -bounds.y))
+        local_rim = (rim_center[0] - bounds.x, rim_center[1] - bounds.y)
+        pygame.draw.circle(pedestal, (62, 66, 72), local_rim, rim_radius)
+        pygame.draw.circle(pedestal, (34, 37, 42), local_rim, self.outer_radius - 8)
+        pedestal.blit(self.image_surface, self.image_rect.move(-bounds.x, -bounds.y))
+        self._pedestal_surface = pedestal.convert_alpha()
+        self._pedestal_origin = bounds.topleft
+
     def set_geometry(self, center: Tuple[int, int], outer_radius: int) -> None:
         self.center = center
         self.outer_radius = max(170, outer_radius)
@@ -459,63 +801,87 @@ class DHDWheel:
         self.inner_ring_outer = int(self.outer_radius * 0.64)
         self.inner_ring_inner = int(self.outer_radius * 0.43)
         self.center_button_radius = int(self.outer_radius * 0.30)
-        self.sectors = self._build_sectors()
+        self._outer_radius_sq = self.outer_radius * self.outer_radius
+        self._outer_ring_inner_sq = self.outer_ring_inner * self.outer_ring_inner
+        self._inner_ring_outer_sq = self.inner_ring_outer * self.inner_ring_outer
+        self._inner_ring_inner_sq = self.inner_ring_inner * self.inner_ring_inner
+        self._center_button_sq = self.center_button_radius * self.center_button_radius
+        self._build_sectors()
+        # Procedural-style floor shadow and centre-button highlight, fixed for this geometry.
+        cx, cy = self.center
+        floor_shadow = pygame.Rect(0, 0, int(self.outer_radius * 2.1), int(self.outer_radius * 0.48))
+        floor_shadow.center = (cx + 8, cy + int(self.outer_radius * 0.65))
+        self._floor_shadow_rects = (floor_shadow, floor_shadow.inflate(-18, -8))
+        self._center_highlight = (
+            (cx - int(self.center_button_radius * 0.26), cy - int(self.center_button_radius * 0.24)),
+            int(self.center_button_radius * 0.28),
+        )
+        # Highlight overlay covering just the DHD, reused every frame. Everything painted
+        # into it (padded sectors, dome highlight and shade) stays within the outer radius.
+        overlay_size = self.outer_radius * 2 + 4
+        self._overlay = pygame.Surface((overlay_size, overlay_size), pygame.SRCALPHA).convert_alpha()
+        self._overlay_origin = (self.center[0] - overlay_size // 2, self.center[1] - overlay_size // 2)
+        # The overlay is repainted only when the highlighted sectors or the centre colour change.
+        self._overlay_sector_key: Optional[Tuple[Optional[int], bytes]] = None
+        self._overlay_center_color: Optional[Tuple[int, int, int, int]] = None
+        center_r = self.center_button_radius - 6
+        self._overlay_center_rect = pygame.Rect(0, 0, center_r * 2 + 2, center_r * 2 + 2)
+        self._overlay_center_rect.center = (self.center[0] - self._overlay_origin[0], self.center[1] - self._overlay_origin[1])
+        ox, oy = self._overlay_origin
+        self._overlay_outlines = self._sector_polygons(pad=4, origin=(ox, oy))
+        mid_radius = (self.sector_inner + self.sector_outer) * 0.5
+        label_x = (self.center[0] + DHD_MID_SIN * mid_radius).astype(np.int32).tolist()
+        label_y = (self.center[1] - DHD_MID_COS * mid_radius).astype(np.int32).tolist()
+        # Mid-point of each sector, by symbol index: label anchor and ripple origin.
+        self.sector_centers = list(zip(label_x, label_y))
+        self._glyph_labels = [
+            (surf, surf.get_rect(center=xy)) for surf, xy in zip(self._glyph_surfaces, self.sector_centers)
+        ]
+        # Cached procedural-style layer, covering the body, its drop shadow and the floor shadow.
+        floor_shadow = self._floor_shadow_rects[0]
+        body = pygame.Rect(0, 0, (self.outer_radius + 11) * 2 + 12, (self.outer_radius + 11) * 2 + 12)
+        body.center = self.center
+        bounds = body.union(floor_shadow)
+        # Opaque with a colour key rather than per-pixel alpha: gfxdraw's anti-aliased outlines
+        # must blend against the drawn sector colours exactly as they would on the screen.
+        self._procedural_layer = pygame.Surface(bounds.size).convert()
+        self._procedural_layer.set_colorkey(PROCEDURAL_LAYER_KEY)
+        self._procedural_origin = bounds.topleft
+        self._procedural_key: Optional[Tuple[Optional[int], bytes]] = None
+        self._fill_outlines = self._sector_polygons(pad=3, origin=self._procedural_origin)
         self._rescale_reference_image()
 
-    def _build_sectors(self) -> List[DHDSector]:
-        sectors: List[DHDSector] = []
-        idx = 0
-
-        outer_count = 27
-        outer_step = 360.0 / outer_count
-        for i in range(outer_count):
-            start = (i * outer_step) % 360.0
-            end = (start + outer_step) % 360.0
-            sectors.append(
-                DHDSector(
-                    index=idx,
-                    start_angle=start,
-                    end_angle=end,
-                    inner_radius=self.outer_ring_inner,
-                    outer_radius=self.outer_radius,
-                )
-            )
-            idx += 1
-
-        inner_count = 12
-        inner_step = 360.0 / inner_count
-        inner_offset = inner_step * 0.5
-        for i in range(inner_count):
-            start = (inner_offset + i * inner_step) % 360.0
-            end = (start + inner_step) % 360.0
-            sectors.append(
-                DHDSector(
-                    index=idx,
-                    start_angle=start,
-                    end_angle=end,
-                    inner_radius=self.inner_ring_inner,
-                    outer_radius=self.inner_ring_outer,
-                )
-            )
-            idx += 1
-
-        return sectors
+    def _build_sectors(self) -> None:
+        # Ring radii of each sector by symbol index (outer ring first, then inner); the angles
+        # do not depend on the geometry and live in DHD_SECTOR_START / DHD_SECTOR_END.
+        self.sector_inner = np.repeat(
+            np.array([self.outer_ring_inner, self.inner_ring_inner], dtype=np.float64), [DHD_OUTER_COUNT, DHD_INNER_COUNT]
+        )
+        self.sector_outer = np.repeat(
+            np.array([self.outer_radius, self.inner_ring_outer], dtype=np.float64), [DHD_OUTER_COUNT, DHD_INNER_COUNT]
+        )
 
     def hit_test(self, pos: Tuple[int, int]) -> Tuple[str, Optional[int]]:
         cx, cy = self.center
         dx = pos[0] - cx
         dy = pos[1] - cy
-        dist = math.hypot(dx, dy)
+        d2 = dx * dx + dy * dy
+        # Most mouse motion is nowhere near the DHD; reject it before any atan2.
+        # Radii are integers, so squared compares match the old sqrt-based checks exactly.
+        if d2 > self._outer_radius_sq:
+            return ("none", None)
 
-        if dist <= self.center_button_radius:
+        if d2 <= self._center_button_sq:
             return ("center", None)
 
-        angle = _cw_angle_from_vector(dx, dy)
-        for sector in self.sectors:
-            if not (sector.inner_radius <= dist <= sector.outer_radius):
-                continue
-            if _angle_in_span(angle, sector.start_angle, sector.end_angle):
-                return ("symbol", sector.index)
+        # Both rings are split into equal sectors, so the index is the clockwise-from-up
+        # angle scaled straight from radians to sectors and floored.
+        if d2 >= self._outer_ring_inner_sq:
+            slot = int((math.atan2(dx, -dy) * DHD_OUTER_PER_RADIAN) % DHD_OUTER_COUNT)
+            return ("symbol", slot % DHD_OUTER_COUNT)
+        if self._inner_ring_inner_sq <= d2 <= self._inner_ring_outer_sq:
+            slot = int((math.atan2(dx, -dy) * DHD_INNER_PER_RADIAN - 0.5) % DHD_INNER_COUNT) % DHD_INNER_COUNT
+            return ("symbol", DHD_OUTER_COUNT + slot)
 
         return ("none", None)
 
@@ -523,120 +889,118 @@ class DHDWheel:
         self,
         surface: pygame.Surface,
         hovered_symbol: Optional[int],
-        symbol_stage: Dict[int, int],
+        symbol_stage: bytes,
         pulse: float,
         connected: bool,
-    ) -> None:
+    ) -> Optional[pygame.Rect]:
+        """Draw the DHD and return the area that may differ from the previous draw, if any."""
         if self.image_surface and self.image_rect:
-            self._draw_reference_style(surface, hovered_symbol, symbol_stage, pulse, connected)
-            return
-        self._draw_procedural_style(surface, hovered_symbol, symbol_stage, pulse, connected)
+            return self._draw_reference_style(surface, hovered_symbol, symbol_stage, pulse, connected)
+        return self._draw_procedural_style(surface, hovered_symbol, symbol_stage, pulse, connected)
 
     def _draw_reference_style(
         self,
         surface: pygame.Surface,
         hovered_symbol: Optional[int],
-        symbol_stage: Dict[int, int],
+        symbol_stage: bytes,
         pulse: float,
         connected: bool,
-    ) -> None:
+    ) -> Optional[pygame.Rect]:
         assert self.image_surface is not None
         assert self.image_rect is not None
 
-        # Grounding shadow and pedestal for depth.
-        shadow = pygame.Surface((self.image_rect.width + 40, self.image_rect.height + 40), pygame.SRCALPHA)
-        ellipse_rect = pygame.Rect(0, 0, int(self.outer_radius * 2.1), int(self.outer_radius * 0.48))
-        ellipse_rect.center = (shadow.get_width() // 2, int(shadow.get_height() * 0.72))
-        pygame.draw.ellipse(shadow, (0, 0, 0, 130), ellipse_rect)
-        pygame.draw.ellipse(shadow, (14, 26, 38, 70), ellipse_rect.inflate(-24, -10))
-        surface.blit(shadow, shadow.get_rect(center=(self.center[0] + 10, self.center[1] + int(self.outer_radius * 0.66))))
-
-        # Back thickness/rim.
-        pygame.draw.circle(surface, (62, 66, 72), (self.center[0] + 5, self.center[1] + 6), self.outer_radius + 8)
-        pygame.draw.circle(surface, (34, 37, 42), (self.center[0] + 5, self.center[1] + 6), self.outer_radius - 8)
+        # Grounding shadow, back rim and wheel art, pre-composited per geometry.
+        surface.blit(self._pedestal_surface, self._pedestal_origin)
 
-        surface.blit(self.image_surface, self.image_rect)
+        # The glow is stepped so the centre button is repainted a few times per pulse
+        # cycle instead of on every frame.
+        level = min(DHD_GLOW_LEVELS - 1, int(pulse * DHD_GLOW_LEVELS))
+        glow_strength = 130 + int(70 * level / (DHD_GLOW_LEVELS - 1))
+        center_color = (255, 134, 34, glow_strength)
+        if connected:
+            center_color = (68, 207, 255, 170)
 
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        overlay = self._overlay
+        sector_key = (hovered_symbol, symbol_stage)
+        changed: Optional[pygame.Rect] = None
+        if sector_key != self._overlay_sector_key:
+            self._overlay_sector_key = sector_key
+            self._overlay_center_color = center_color
+            self._paint_overlay(hovered_symbol, symbol_stage, center_color)
+            changed = overlay.get_rect(topleft=self._overlay_origin)
+        elif center_color != self._overlay_center_color:
+            # Only the pulsing centre button changed; repaint just its square.
+            self._overlay_center_color = center_color
+            overlay.set_clip(self._overlay_center_rect)
+            self._paint_overlay(hovered_symbol, symbol_stage, center_color)
+            overlay.set_clip(None)
+            changed = self._overlay_center_rect.move(self._overlay_origin)
+
+        surface.blit(overlay, self._overlay_origin)
+        return changed
+
+    def _paint_overlay(
+        self, hovered_symbol: Optional[int], symbol_stage: bytes, center_color: Tuple[int, int, int, int]
+    ) -> None:
+        """Redraw the reference-style highlight overlay, limited to its current clip rect."""
+        overlay = self._overlay
+        overlay.fill((0, 0, 0, 0))
+        ox, oy = self._overlay_origin
+        cx, cy = self.center[0] - ox, self.center[1] - oy
 
-        for sector in self.sectors:
-            stage = symbol_stage.get(sector.index, 0)
+        for index, (stage, outline) in enumerate(zip(symbol_stage, self._overlay_outlines)):
             color = None
             if stage == 2:
                 color = (255, 139, 36, 150)
             elif stage == 1:
                 color = (58, 173, 255, 122)
-            if hovered_symbol == sector.index:
+            if hovered_symbol == index:
                 color = (255, 218, 166, 128)
 
+            # draw.polygon writes the RGBA value straight into the overlay; gfxdraw would
+            # blend it against the cleared pixels and halve the alpha.
             if color:
-                pygame.draw.polygon(overlay, color, self._sector_polygon(sector, pad=4))
+                pygame.draw.polygon(overlay, color, outline)
 
-        glow_strength = 130 + int(70 * pulse)
-        center_color = (255, 134, 34, glow_strength)
-        if connected:
-            center_color = (68, 207, 255, 170)
-        pygame.draw.circle(overlay, center_color, self.center, self.center_button_radius - 6)
+        pygame.draw.circle(overlay, center_color, (cx, cy), self.center_button_radius - 6)
 
         # Top-left highlight / bottom-right shade to fake curved dome lighting.
         pygame.draw.circle(
             overlay,
             (255, 255, 255, 52),
-            (self.center[0] - int(self.outer_radius * 0.26), self.center[1] - int(self.outer_radius * 0.22)),
+            (cx - int(self.outer_radius * 0.26), cy - int(self.outer_radius * 0.22)),
             int(self.outer_radius * 0.58),
             0,
         )
         pygame.draw.circle(
             overlay,
             (0, 0, 0, 66),
-            (self.center[0] + int(self.outer_radius * 0.20), self.center[1] + int(self.outer_radius * 0.26)),
+            (cx + int(self.outer_radius * 0.20), cy + int(self.outer_radius * 0.26)),
             int(self.outer_radius * 0.74),
             0,
         )
 
-        surface.blit(overlay, (0, 0))
-
     def _draw_procedural_style(
         self,
         surface: pygame.Surface,
         hovered_symbol: Optional[int],
-        symbol_stage: Dict[int, int],
+        symbol_stage: bytes,
         pulse: float,
         connected: bool,
-    ) -> None:
-        cx, cy = self.center
-        floor_shadow = pygame.Rect(0, 0, int(self.outer_radius * 2.1), int(self.outer_radius * 0.48))
-        floor_shadow.center = (cx + 8, cy + int(self.outer_radius * 0.65))
-        pygame.draw.ellipse(surface, (0, 0, 0), floor_shadow)
-        pygame.draw.ellipse(surface, (20, 32, 44), floor_shadow.inflate(-18, -8))
-
-        pygame.draw.circle(surface, (48, 52, 58), (cx + 5, cy + 6), self.outer_radius + 11)
-        pygame.draw.circle(surface, (36, 40, 46), self.center, self.outer_radius + 9)
-        pygame.draw.circle(surface, (172, 176, 182), self.center, self.outer_radius + 2)
-        pygame.draw.circle(surface, (80, 86, 94), self.center, self.outer_radius + 2, 4)
-
-        for sector in self.sectors:
-            stage = symbol_stage.get(sector.index, 0)
-            fill = (228, 231, 236)
-            if stage == 1:
-                fill = (206, 233, 252)
-            elif stage == 2:
-                fill = (248, 200, 140)
-            if hovered_symbol == sector.index:
-                fill = (255, 244, 208)
-
-            poly = self._sector_polygon(sector, pad=3)
-            pygame.draw.polygon(surface, fill, poly)
-            pygame.draw.polygon(surface, (94, 100, 112), poly, 2)
-
-            glyph = GLYPH_CHARS[sector.index] if 0 <= sector.index < len(GLYPH_CHARS) else "?"
-            label = self.font.render(glyph, True, (38, 42, 48))
-            mid_angle = (sector.start_angle + ((sector.end_angle - sector.start_angle) % 360.0) * 0.5) % 360.0
-            rad = math.radians(mid_angle)
-            mid_radius = (sector.inner_radius + sector.outer_radius) * 0.5
-            x = cx + math.sin(rad) * mid_radius
-            y = cy - math.cos(rad) * mid_radius
-            surface.blit(label, label.get_rect(center=(int(x), int(y))))
+    ) -> Optional[pygame.Rect]:
+        # Shadow, body, sectors and labels only change with the hover and stages; everything
+        # in them is opaque, so a cached copy blits back pixel-for-pixel.
+        layer_key = (hovered_symbol, symbol_stage)
+        if layer_key != self._procedural_key:
+            self._procedural_key = layer_key
+            self._paint_procedural_layer(hovered_symbol, symbol_stage)
+            changed = self._procedural_layer.get_rect(topleft=self._procedural_origin)
+        else:
+            # The centre glow pulses every frame.
+            glow_span = (self.center_button_radius + 7) * 2 + 1
+            changed = pygame.Rect(0, 0, glow_span, glow_span)
+            changed.center = self.center
+        surface.blit(self._procedural_layer, self._procedural_origin)
 
         center_color = (255, 132, 36)
         if connected:
@@ -645,45 +1009,78 @@ class DHDWheel:
         pygame.draw.circle(surface, (255, 171, 86), self.center, glow_radius)
         pygame.draw.circle(surface, center_color, self.center, self.center_button_radius)
         pygame.draw.circle(surface, (85, 48, 24), self.center, self.center_button_radius, 3)
-        pygame.draw.circle(
-            surface,
-            (255, 227, 188),
-            (cx - int(self.center_button_radius * 0.26), cy - int(self.center_button_radius * 0.24)),
-            int(self.center_button_radius * 0.28),
-        )
-
-    def _sector_polygon(self, sector: DHDSector, pad: int = 0) -> List[Tuple[int, int]]:
-        start = sector.start_angle
-        sweep = (sector.end_angle - sector.start_angle) % 360.0
-        steps = max(6, int(sweep / 2.5))
+        pygame.draw.circle(surface, (255, 227, 188), *self._center_highlight)
+        return changed
+
+    def _paint_procedural_layer(self, hovered_symbol: Optional[int], symbol_stage: bytes) -> None:
+        """Redraw the static part of the procedural DHD into its cached layer."""
+        layer = self._procedural_layer
+        layer.fill(PROCEDURAL_LAYER_KEY)
+        ox, oy = self._procedural_origin
+        cx, cy = self.center[0] - ox, self.center[1] - oy
+        floor_shadow, floor_shadow_inner = self._floor_shadow_rects
+        pygame.draw.ellipse(layer, (0, 0, 0), floor_shadow.move(-ox, -oy))
+        pygame.draw.ellipse(layer, (20, 32, 44), floor_shadow_inner.move(-ox, -oy))
+
+        pygame.draw.circle(layer, (48, 52, 58), (cx + 5, cy + 6), self.outer_radius + 11)
+        pygame.draw.circle(layer, (36, 40, 46), (cx, cy), self.outer_radius + 9)
+        pygame.draw.circle(layer, (172, 176, 182), (cx, cy), self.outer_radius + 2)
+        pygame.draw.circle(layer, (80, 86, 94), (cx, cy), self.outer_radius + 2, 4)
+
+        for index, (stage, outline) in enumerate(zip(symbol_stage, self._fill_outlines)):
+            fill = (228, 231, 236)
+            if stage == 1:
+                fill = (206, 233, 252)
+            elif stage == 2:
+                fill = (248, 200, 140)
+            if hovered_symbol == index:
+                fill = (255, 244, 208)
 
-        outer_radius = max(1.0, sector.outer_radius - pad)
-        inner_radius = max(1.0, sector.inner_radius + pad)
+            # Anti-aliased outline over a plain fill; smoother than the 2 px aliased edge.
+            pygame.gfxdraw.filled_polygon(layer, outline, fill)
+            pygame.gfxdraw.aapolygon(layer, outline, (94, 100, 112))
 
-        points: List[Tuple[int, int]] = []
-        for i in range(steps + 1):
-            angle = (start + sweep * (i / steps)) % 360.0
-            rad = math.radians(angle)
-            x = self.center[0] + math.sin(rad) * outer_radius
-            y = self.center[1] - math.cos(rad) * outer_radius
-            points.append((int(x), int(y)))
+        # Labels sit inside their own sector, so they can all go out in one batched call.
+        layer.blits([(label, rect.move(-ox, -oy)) for label, rect in self._glyph_labels], doreturn=False)
 
-        for i in range(steps, -1, -1):
-            angle = (start + sweep * (i / steps)) % 360.0
-            rad = math.radians(angle)
-            x = self.center[0] + math.sin(rad) * inner_radius
-            y = self.center[1] - math.cos(rad) * inner_radius
-            points.append((int(x), int(y)))
+    def _sector_polygons(self, pad: int = 0, origin: Tuple[int, int] = (0, 0)) -> List[List[Tuple[int, int]]]:
+        """Outline of every sector inset by pad, relative to origin, evaluated for all sectors at once."""
+        outer = np.maximum(1.0, self.sector_outer - pad)[:, None]
+        inner = np.maximum(1.0, self.sector_inner + pad)[:, None]
+        cx, cy = self.center
 
-        return points
+        # Outer arc forward, inner arc back.
+        xs = np.concatenate(
+            [(cx + DHD_ARC_SIN * outer).astype(np.int32), (cx + DHD_ARC_SIN * inner).astype(np.int32)[:, ::-1]], axis=1
+        )
+        ys = np.concatenate(
+            [(cy - DHD_ARC_COS * outer).astype(np.int32), (cy - DHD_ARC_COS * inner).astype(np.int32)[:, ::-1]], axis=1
+        )
+        xs -= origin[0]
+        ys -= origin[1]
+        return [list(zip(x, y)) for x, y in zip(xs.tolist(), ys.tolist())]
 
 
 class StargateApp:
     def __init__(self) -> None:
         self.logger = AppLogger(_runtime_dir())
         self.settings = load_settings(_runtime_dir())
+        self.logger.level = LOG_LEVELS.get(str(self.settings["log_level"]).upper(), LOG_LEVELS["INFO"])
+        # Must precede pygame.init(), which opens the mixer. The synthesised PCM is raw
+        # 44.1 kHz mono int16, so SDL must convert rather than change the device format.
+        audio_buffer = max(128, min(4096, int(self.settings["audio_buffer"])))
+        pygame.mixer.pre_init(44100, -16, 1, audio_buffer, allowedchanges=0)
         pygame.init()
         self.assets = _asset_dir()
+        # The DHD artwork is the largest file read at startup. image.load releases the GIL,
+        # so decode it on a worker thread while the window, fonts and audio are set up.
+        decoded_reference: List[Optional[pygame.Surface]] = []
+        reference_loader = threading.Thread(
+            target=lambda: decoded_reference.append(_decode_reference_image(self.assets)),
+            name="DHDImage",
+            daemon=True,
+        )
+        reference_loader.start()
 
         w = int(self.settings["window_width"])
         h = int(self.settings["window_height"])
@@ -697,7 +1094,25 @@ class StargateApp:
         except Exception:
             pass
         pygame.display.set_caption("Stargate Dialing Computer + DHD")
+        # Frame pacing: the loop sleeps once per frame, either in clock.tick or (while throttled)
+        # in event.wait, then drains the whole queue with a single event.get(). Don't poll
+        # events one at a time elsewhere.
         self.clock = pygame.time.Clock()
+        self._frame_started_at = 0
+        # Input nobody reads is dropped at the SDL layer instead of being drained through Python
+        # every frame. Window events stay untouched: VIDEORESIZE is derived from them.
+        pygame.event.set_blocked(
+            [
+                pygame.KEYUP,
+                pygame.MOUSEBUTTONUP,
+                pygame.TEXTINPUT,
+                pygame.TEXTEDITING,
+                pygame.FINGERDOWN,
+                pygame.FINGERUP,
+                pygame.FINGERMOTION,
+                pygame.MULTIGESTURE,
+            ]
+        )
 
         self.font_sm = pygame.font.SysFont("bahnschrift", 20)
         self.font_md = pygame.font.SysFont("bahnschrift", 28, bold=True)
@@ -706,6 +1121,8 @@ class StargateApp:
         self.glyph_font_md = pygame.font.SysFont("consolas", 32, bold=True)
         self.gate_glyph_font = pygame.font.SysFont("consolas", 20, bold=True)
         self._gate_glyph_font_size = 20
+        # Opened gate glyph fonts by pixel size, least recently used first.
+        self._gate_glyph_fonts: Dict[int, pygame.font.Font] = {}
         self.glyph_chars = ASCII_GLYPH_CHARS
         glyph_font_path = self._find_glyph_font_path()
         if glyph_font_path:
@@ -716,8 +1133,14 @@ class StargateApp:
             except pygame.error:
                 self.glyph_chars = ASCII_GLYPH_CHARS
 
-        self.audio = GateAudio(self.assets)
-        self.dhd = DHDWheel(center=(1110, 520), assets=self.assets, font=self.font_sm)
+        self.audio = GateAudio(self.assets, cache_dir=_runtime_dir() / "cache")
+        reference_loader.join()
+        self.dhd = DHDWheel(
+            center=(1110, 520),
+            assets=self.assets,
+            font=self.font_sm,
+            reference=decoded_reference[0] if decoded_reference else None,
+        )
 
         self.controls: List[Button] = []
         self.preset_buttons: List[Button] = []
@@ -727,6 +1150,44 @@ class StargateApp:
         self.gate_outer_radius = 305
         self.gate_ring_radius = 253
         self.gate_inner_radius = 195
+        # Unit-circle offsets of each ring symbol; rotated by ring_angle when drawn.
+        symbol_angles = np.radians(np.arange(SYMBOL_COUNT) * (360.0 / SYMBOL_COUNT))
+        self._ring_unit_cos = np.cos(symbol_angles)
+        self._ring_unit_sin = np.sin(symbol_angles)
+        # Pre-rendered button pills keyed by (size, label, fill, text colour, hover).
+        self._pill_cache: Dict[Tuple[Tuple[int, int], str, Tuple[int, int, int], Tuple[int, int, int], bool], pygame.Surface] = {}
+        self.hovered_button: Optional[Button] = None
+        self._horizon_disc: Optional[pygame.Surface] = None
+        self._horizon_disc_radius = 0
+        # Specular highlight sprites by radius, dropped when the horizon is resized.
+        self._spec_sprites: Dict[int, pygame.Surface] = {}
+        self._fade_radius = 0
+        self._status_key: Optional[Tuple[str, int]] = None
+        # Cached console panel layer (see _draw_console) and the inputs it was painted from.
+        self._console_layer: Optional[pygame.Surface] = None
+        self._console_origin = (0, 0)
+        self._console_key: Optional[Tuple[Any, ...]] = None
+        # Top of the status line in the console layer, where a status-only repaint starts.
+        self._console_status_top = 0
+        # Key hint texts and positions, rebuilt when the console layout moves.
+        self._hint_key: Optional[Tuple[int, int, int, int]] = None
+        self._hint_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._truncate_cache: Dict[Tuple[pygame.font.Font, str, int], str] = {}
+        self._glyph_presence: Dict[Tuple[pygame.font.Font, str], bool] = {}
+        self._ring_glyph_cache: Dict[Tuple[pygame.font.Font, int, Tuple[int, int, int]], pygame.Surface] = {}
+        self._ring_glow_sprites = self._build_ring_glow_sprites()
+        self._status_surfaces: List[pygame.Surface] = []
+        self._glyph_line_key: Optional[Tuple[str, int]] = None
+        self._glyph_line_surface: Optional[pygame.Surface] = None
+        self._chevron_polys: List[Tuple[List[Tuple[int, int]], List[Tuple[int, int]], List[Tuple[int, int]], Tuple[int, int]]] = []
+        self._chevron_polys_key: Optional[Tuple[Tuple[int, int], int]] = None
+        self._chevron_glow_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        self._inner_glow_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        # Last finished (tilted) gate and side sprites, reused while _gate_sprite_key is unchanged.
+        self._gate_sprite: Optional[pygame.Surface] = None
+        self._gate_side_sprite: Optional[pygame.Surface] = None
+        self._gate_sprite_key_drawn: Optional[Tuple] = None
         self._rebuild_layout()
 
         self.running = True
@@ -734,9 +1195,22 @@ class StargateApp:
         self.entered_symbols: List[int] = []
         self.current_address: List[int] = []
         self.locked_count = 0
+        self._symbol_stage = bytes(SYMBOL_COUNT)
+        self._entered_stages: Dict[int, str] = {}
+        self._locked_stages: Dict[int, str] = {}
+        self._glyph_string = ""
+        self._index_text = "Glyphs: -"
         self.state = "IDLE"  # IDLE, DIALING, OPENING, CONNECTED
+        # Per-frame work for each state; IDLE has none.
+        self._state_ticks: Dict[str, Callable[[int, float], None]] = {
+            "DIALING": self._tick_dialing,
+            "OPENING": self._tick_opening,
+            "CONNECTED": self._tick_connected,
+        }
 
         self.hovered_symbol: Optional[int] = None
+        # Last DHD hit test from mouse motion: (pos, kind, index); cleared when the layout changes.
+        self._dhd_hit: Optional[Tuple[Tuple[int, int], str, Optional[int]]] = None
         self.ring_angle = 0.0
         self.ring_target_angle = 0.0
         self.ring_speed = 0.0
@@ -749,14 +1223,29 @@ class StargateApp:
         self.open_finish_at = 0
         self.opening_started_at = 0
         self.connected_since = 0
+        self._status_tenths = -1
+        self._frame_ticks = 0
         self.dial_failed = False
         self.fail_flash_until = 0
         # Each ripple: (spawn_time_ms, origin_x, origin_y)
         self.dhd_ripples: List[Tuple[int, int, int]] = []
+        # Scratch layer the ripples are blended through; grown on demand, never shrunk.
+        self._ripple_layer: Optional[pygame.Surface] = None
+        self._fail_flash_layer: Optional[pygame.Surface] = None
+        # Opaque horizontal and vertical bands for the auto-close warning border.
+        self._warning_strips: Optional[Tuple[pygame.Surface, pygame.Surface]] = None
+        # Window areas run() presents after a quiet IDLE frame (None: the whole window), the
+        # scene state that judgement was made against, and the squares last frame's stars covered.
+        self._present_rects: Optional[List[pygame.Rect]] = None
+        self._present_key: Optional[Tuple[Any, ...]] = None
+        self._star_rects: List[pygame.Rect] = []
         # Screensaver state.
         self.screensaver_active = False
         self.last_interaction_at = pygame.time.get_ticks()
         self.screensaver_hold_until = 0   # how long to keep connection before re-dialing
+        # Idle timeout in ticks, so the per-frame check is a plain integer comparison.
+        self.screensaver_idle_ms = int(float(self.settings.get("screensaver_idle_seconds", 60)) * 1000)
+        self.dialing_speed_multiplier = float(self.settings.get("dialing_speed_multiplier", 1.0))
         # Iris state.
         self.iris_closed = False          # whether the iris is currently closed
         self.iris_angle = 0.0             # animation progress 0 (open) → 1 (closed)
@@ -769,41 +1258,36 @@ class StargateApp:
         self.log_scroll = 0        # topmost visible entry index
         self.show_log = False      # toggle with Tab
 
-        rng = random.Random(42)
-        self.stars = [
-            (
-                rng.randint(0, WINDOW_SIZE[0] - 1),
-                rng.randint(0, WINDOW_SIZE[1] - 1),
-                rng.randint(1, 3),
-                rng.uniform(0.0, 6.2),
-            )
-            for _ in range(180)
-        ]
+        # Star columns as arrays so the twinkle and drift are computed in one pass per frame.
+        star_rng = np.random.default_rng(42)
+        star_count = 180
+        self._star_x = star_rng.integers(0, WINDOW_SIZE[0], star_count).astype(np.float64)
+        self._star_y = star_rng.integers(0, WINDOW_SIZE[1], star_count).astype(np.float64)
+        star_size = star_rng.integers(1, 4, star_count)
+        self._star_phase = star_rng.uniform(0.0, 6.2, star_count)
+        # Per-star constants of the drift kernel, hoisted out of the frame loop.
+        self._star_drift = 2 + star_size * 0.9
+        self._star_phase_offset = self._star_phase * 8
+        self._star_parallax = star_size / 3.0  # small stars are "farther away"
+        self._star_radius = star_size
+        # Every pixel each star covers, in star order: (star index, dx, dy). There are only
+        # a few star sizes, so each circle is rasterised once and its offsets reused.
+        sizes = star_size.tolist()
+        offsets = {size: _circle_offsets(size) for size in set(sizes)}
+        self._star_stamp_idx = np.repeat(np.arange(star_count, dtype=np.int32), [len(offsets[s][0]) for s in sizes])
+        self._star_stamp_dx = np.concatenate([offsets[s][0] for s in sizes])
+        self._star_stamp_dy = np.concatenate([offsets[s][1] for s in sizes])
         self.logger.info(
             "Application initialized",
             assets=str(self.assets),
             window=f"{self.screen.get_width()}x{self.screen.get_height()}",
             logs=str(self.logger.log_path),
-        )
-        self.logger.info(
-            "Audio mapping",
-            press=self.audio.loaded_from.get("press", "missing"),
-            engage=self.audio.loaded_from.get("engage", "missing"),
-            ring=self.audio.loaded_from.get("ring", "missing"),
-            lock=self.audio.loaded_from.get("lock", "missing"),
-            kawoosh=self.audio.loaded_from.get("kawoosh", "missing"),
-            close=self.audio.loaded_from.get("close", "missing"),
-            connected=self.audio.loaded_from.get("connected", "missing"),
+            **self.audio.sources(LOGGED_SOUNDS),
         )
         # Apply volume settings.
         vol = float(self.settings.get("volume_master", 1.0))
         amb = float(self.settings.get("volume_ambient", 1.0))
-        for key, snd in self.audio.sounds.items():
-            base = snd.get_volume()
-            if key.startswith("ambient"):
-                snd.set_volume(min(1.0, base * vol * amb))
-            else:
-                snd.set_volume(min(1.0, base * vol))
+        self.audio.set_volume_scale(vol, amb)
         self.audio.start_ambient("ambient_idle")
 
     def _find_glyph_font_path(self) -> Optional[Path]:
@@ -826,27 +1310,65 @@ class StargateApp:
     ) -> pygame.Surface:
         fallback_font = fallback_font or self.font_sm
         attempt = text if text else fallback_text
+        # Skip the speculative render when the font is already known to lack a character.
+        if self._font_has_glyphs(font, attempt):
+            try:
+                surface = font.render(attempt, True, color)
+                if surface.get_width() > 0:
+                    return surface.convert_alpha()
+            except pygame.error:
+                pass
         try:
-            surface = font.render(attempt, True, color)
-            if surface.get_width() > 0:
-                return surface
-        except pygame.error:
-            pass
-        try:
-            return fallback_font.render(fallback_text or "?", True, color)
+            return fallback_font.render(fallback_text or "?", True, color).convert_alpha()
         except pygame.error:
-            return pygame.font.Font(None, 24).render("?", True, color)
+            return pygame.font.Font(None, 24).render("?", True, color).convert_alpha()
+
+    def _font_has_glyphs(self, font: pygame.font.Font, text: str) -> bool:
+        """True when the font has a glyph for every character, probed once per font and character."""
+        for char in text:
+            key = (font, char)
+            present = self._glyph_presence.get(key)
+            if present is None:
+                try:
+                    metrics = font.metrics(char)
+                    present = bool(metrics) and metrics[0] is not None
+                except pygame.error:
+                    present = False
+                self._glyph_presence[key] = present
+            if not present:
+                return False
+        return True
+
+    def _text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text once and reuse the surface while the same string is on screen."""
+        key = (font, text, color)
+        surface = self._text_cache.pop(key, None)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                del self._text_cache[next(iter(self._text_cache))]
+        self._text_cache[key] = surface
+        return surface
 
     def _truncate_text(self, font: pygame.font.Font, text: str, max_width: int) -> str:
         if max_width <= 0:
             return ""
-        if font.size(text)[0] <= max_width:
-            return text
-        suffix = "..."
-        shortened = text
-        while shortened and font.size(shortened + suffix)[0] > max_width:
-            shortened = shortened[:-1]
-        return (shortened + suffix) if shortened else suffix
+        # Console lines are re-measured every frame; remember each fit instead of probing font.size again.
+        key = (font, text, max_width)
+        fitted = self._truncate_cache.get(key)
+        if fitted is not None:
+            return fitted
+        fitted = text
+        if font.size(text)[0] > max_width:
+            suffix = "..."
+            shortened = text
+            while shortened and font.size(shortened + suffix)[0] > max_width:
+                shortened = shortened[:-1]
+            fitted = (shortened + suffix) if shortened else suffix
+        if len(self._truncate_cache) >= TEXT_CACHE_LIMIT:
+            self._truncate_cache.clear()
+        self._truncate_cache[key] = fitted
+        return fitted
 
     def _wrap_text(
         self,
@@ -892,34 +1414,37 @@ class StargateApp:
         pixel_size = max(12, pixel_size)
         if pixel_size == self._gate_glyph_font_size:
             return
+        # A window drag sweeps back and forth over the same sizes; reusing the Font object
+        # also keeps its rendered ring glyphs valid, since those are cached per font.
+        font = self._gate_glyph_fonts.pop(pixel_size, None)
+        if font is None:
+            font = self._load_gate_glyph_font(pixel_size)
+            if len(self._gate_glyph_fonts) >= GATE_GLYPH_FONT_CACHE_LIMIT:
+                del self._gate_glyph_fonts[next(iter(self._gate_glyph_fonts))]
+        self._gate_glyph_fonts[pixel_size] = font
+        self.gate_glyph_font = font
+        self._gate_glyph_font_size = pixel_size
+
+    def _load_gate_glyph_font(self, pixel_size: int) -> pygame.font.Font:
         font_path = self._find_glyph_font_path()
         if font_path:
             try:
-                self.gate_glyph_font = pygame.font.Font(str(font_path), pixel_size)
-                self._gate_glyph_font_size = pixel_size
-                return
+                return pygame.font.Font(str(font_path), pixel_size)
             except pygame.error:
                 pass
-        self.gate_glyph_font = pygame.font.SysFont("consolas", pixel_size, bold=True)
-        self._gate_glyph_font_size = pixel_size
+        return pygame.font.SysFont("consolas", pixel_size, bold=True)
 
-    def _gate_symbol_stage(self, symbol_index: int) -> str:
-        if symbol_index in self.current_address[: self.locked_count]:
-            return "locked"
+    def _gate_symbol_stages(self) -> Dict[int, str]:
+        """Stage of every non-idle ring symbol; later writes take priority."""
+        stages: Dict[int, str] = {POINT_OF_ORIGIN: "poo_idle"} if self.state == "IDLE" else {}
+        stages.update(self._entered_stages)
         if self.state == "DIALING" and self.dial_step_index < len(self.current_address):
-            if symbol_index == self.current_address[self.dial_step_index]:
-                return "active"
-        if symbol_index in self.entered_symbols:
-            # Last entered symbol is treated as Point of Origin.
-            if self.entered_symbols and symbol_index == self.entered_symbols[-1]:
-                return "poo"
-            return "selected"
-        if symbol_index == POINT_OF_ORIGIN and self.state == "IDLE":
-            return "poo_idle"
-        return "idle"
+            stages[self.current_address[self.dial_step_index]] = "active"
+        stages.update(self._locked_stages)
+        return stages
 
     def _symbol_alignment_angle(self, symbol_index: int) -> float:
-        return TOP_CHEVRON_ANGLE_DEG - symbol_index * SYMBOL_ARC_DEG
+        return SYMBOL_ALIGNMENT_ANGLES[symbol_index]
 
     def _begin_next_dial_step(self) -> None:
         if self.dial_step_index >= len(self.current_address):
@@ -939,8 +1464,7 @@ class StargateApp:
             desired_angle = self.ring_angle - travel
 
         self.ring_target_angle = desired_angle
-        speed_mul = float(self.settings.get("dialing_speed_multiplier", 1.0))
-        self.ring_speed = (DIAL_SPIN_BASE_SPEED + min(110.0, self.dial_step_index * DIAL_SPIN_SPEED_STEP)) * speed_mul
+        self.ring_speed = DIAL_SPIN_SPEEDS[self.dial_step_index] * self.dialing_speed_multiplier
         self.dial_phase = "SPINNING"
         self.status = f"Dialing symbol {self.dial_step_index + 1}/{len(self.current_address)}..."
         self.logger.info(
@@ -952,7 +1476,7 @@ class StargateApp:
         )
 
     def _finish_dialing(self, now: int) -> None:
-        is_known = any(self.current_address == addr for addr in KNOWN_ADDRESSES.values())
+        is_known = tuple(self.current_address) in KNOWN_ADDRESS_NAMES
         fail_chance = float(self.settings.get("dial_fail_chance", DIAL_FAIL_CHANCE))
         if not is_known and random.random() < fail_chance:
             self._fail_dial(now)
@@ -974,6 +1498,7 @@ class StargateApp:
         self.locked_count = 0
         self.current_address.clear()
         self.entered_symbols.clear()
+        self._rebuild_symbol_stage()
         self.status = "LOCK FAILURE — destination could not be confirmed."
         self.dial_log.append({
             "time": datetime.now().strftime("%H:%M:%S"),
@@ -989,6 +1514,9 @@ class StargateApp:
 
     def _rebuild_layout(self) -> None:
         width, height = self.screen.get_size()
+        self._layout_size = (width, height)
+        self._dhd_hit = None
+        self._build_background_gradient()
         margin = max(14, int(min(width, height) * 0.016))
 
         right_width = int(width * PANEL_WIDTH_RATIO)
@@ -1020,6 +1548,7 @@ class StargateApp:
         self.gate_outer_radius = gate_outer
         self.gate_ring_radius = int(gate_outer * 0.83)
         self.gate_inner_radius = int(gate_outer * 0.64)
+        self._build_gate_static_layer()
 
         dhd_radius = int(min(self.panel_rect.width * 0.36, self.panel_rect.height * 0.25))
         dhd_center = (
@@ -1029,7 +1558,103 @@ class StargateApp:
         self.dhd.set_geometry(dhd_center, dhd_radius)
         self._build_buttons()
 
+    def _build_background_gradient(self) -> None:
+        """Render the static sky gradient, floor plane and nebula sprites once per window size."""
+        width, height = self.screen.get_size()
+        blend = np.arange(height) / height
+        rows = np.stack([6 + 18 * blend, 10 + 19 * blend, 26 + 26 * blend], axis=1).astype(np.uint8)
+        gradient = pygame.Surface((width, height)).convert()
+        # surfarray is indexed [x, y], so repeat the per-row colours across x.
+        pygame.surfarray.blit_array(gradient, np.broadcast_to(rows, (width, height, 3)))
+        self._background_gradient = gradient
+        # Gradient, nebulas and floor, recomposed only when a nebula moves or changes glow step.
+        self._sky_layer = gradient.copy()
+        self._sky_key: Optional[Tuple[Tuple[int, int, int], ...]] = None
+
+        # The perspective floor is static too; it is blended over the nebulas when the sky is recomposed.
+        floor = pygame.Surface((width, height), pygame.SRCALPHA)
+        horizon_y = int(height * 0.62)
+        floor_poly = [(0, height), (width, height), (int(width * 0.58), horizon_y), (int(width * 0.08), horizon_y)]
+        pygame.draw.polygon(floor, (8, 14, 24, 122), floor_poly)
+        for i in range(11):
+            t = (i + 1) / 12.0
+            y = int(horizon_y + (height - horizon_y) * (t * t))
+            alpha = int(22 + 48 * (1.0 - t))
+            pygame.draw.line(floor, (44, 74, 106, alpha), (0, y), (width, y), 1)
+        vanishing_x = int(width * 0.33)
+        for i in range(-6, 7):
+            px = int(vanishing_x + i * width * 0.09)
+            pygame.draw.line(floor, (36, 62, 92, 34), (px, height), (vanishing_x, horizon_y), 1)
+        # Everything above the horizon is transparent; keep only the band that is drawn.
+        self._background_floor = floor.subsurface((0, horizon_y, width, height - horizon_y)).convert_alpha()
+        self._background_floor_y = horizon_y
+
+        # One small sprite per nebula; only its position and alpha change per frame.
+        self._nebula_sprites: List[Tuple[pygame.Surface, int, int, int, float]] = []
+        for base_cx, base_cy, radius, phase in (
+            (int(width * 0.16), int(height * 0.18), int(height * 0.30), 0.7),
+            (int(width * 0.40), int(height * 0.74), int(height * 0.38), 1.2),
+            (int(width * 0.84), int(height * 0.18), int(height * 0.29), 0.4),
+        ):
+            sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (26, 62, 112), (radius + 1, radius + 1), radius)
+            self._nebula_sprites.append((sprite.convert_alpha(), base_cx, base_cy, radius, phase))
+
+    def _build_gate_static_layer(self) -> None:
+        """Pre-render the gate body (rings and bevels), which only changes on resize."""
+        outer_radius = self.gate_outer_radius
+        ring_radius = self.gate_ring_radius
+        inner_radius = self.gate_inner_radius
+        pad = outer_radius + 70
+        layer = pygame.Surface((pad * 2, pad * 2), pygame.SRCALPHA)
+        local_center = (pad, pad)
+
+        pygame.draw.circle(layer, (122, 128, 138), local_center, outer_radius)
+        pygame.draw.circle(layer, (74, 81, 91), local_center, outer_radius - 16)
+        pygame.draw.circle(layer, (142, 148, 158), local_center, ring_radius + 14, 24)
+        pygame.draw.circle(layer, (25, 33, 43), local_center, inner_radius)
+
+        # Metallic bevel highlights and shadows.
+        outer_highlight = pygame.Rect(
+            local_center[0] - outer_radius,
+            local_center[1] - outer_radius,
+            outer_radius * 2,
+            outer_radius * 2,
+        )
+        pygame.draw.arc(layer, (236, 242, 255, 80), outer_highlight, math.radians(210), math.radians(330), 6)
+        pygame.draw.arc(layer, (10, 14, 20, 120), outer_highlight, math.radians(30), math.radians(140), 10)
+        ring_rect = pygame.Rect(local_center[0] - ring_radius, local_center[1] - ring_radius, ring_radius * 2, ring_radius * 2)
+        pygame.draw.arc(layer, (225, 234, 248, 70), ring_rect, math.radians(195), math.radians(315), 4)
+        pygame.draw.arc(layer, (5, 9, 15, 130), ring_rect, math.radians(8), math.radians(132), 6)
+        self._gate_static_layer = layer.convert_alpha()
+        # Perspective compression of the finished gate layer, and the tint for its side-thickness
+        # copy. A BLEND_RGB_MULT blit from an opaque surface gives exactly what
+        # fill(..., BLEND_RGBA_MULT) did, several times faster.
+        self._gate_tilt_size = (pad * 2, max(1, int(pad * 2 * 0.84)))
+        self._gate_side_tint = pygame.Surface(self._gate_tilt_size).convert()
+        self._gate_side_tint.fill((45, 48, 55))
+        self._inner_glow_cache.clear()
+        self._gate_sprite_key_drawn = None
+
+        # Ground shadow under the gate, sized to the ellipse rather than the whole screen.
+        shadow_rect = pygame.Rect(0, 0, int(outer_radius * 2.2), int(outer_radius * 0.55))
+        shadow = pygame.Surface(shadow_rect.size, pygame.SRCALPHA)
+        pygame.draw.ellipse(shadow, (0, 0, 0, 125), shadow_rect)
+        pygame.draw.ellipse(shadow, (14, 26, 40, 68), shadow_rect.inflate(-24, -10))
+        shadow_rect.center = (self.gate_center[0], int(self.gate_center[1] + outer_radius * 1.02))
+        self._gate_shadow = shadow.convert_alpha()
+        self._gate_shadow_pos = shadow_rect.topleft
+
+        # Rounded frame around the gate view, and where stars still show around it ([x, y]).
+        self._gate_frame_rect = self.left_view_rect.inflate(-12, -12)
+        frame_mask = pygame.Surface(self.screen.get_size())
+        pygame.draw.rect(frame_mask, (255, 255, 255), self._gate_frame_rect, border_radius=16)
+        pygame.draw.rect(frame_mask, (255, 255, 255), self._gate_frame_rect, width=2, border_radius=16)
+        self._star_open = pygame.surfarray.array_red(frame_mask) == 0
+
     def _build_buttons(self) -> None:
+        self._pill_cache.clear()
+        self.hovered_button = None
         gap = 10
         # 4 known presets + 1 RANDOM button = 5 columns.
         preset_w = int((self.panel_rect.width - gap * 6) / 5)
@@ -1051,6 +1676,9 @@ class StargateApp:
         # RANDOM button at the end.
         rect = pygame.Rect(x, top_y, preset_w, preset_h)
         self.preset_buttons.append(Button(rect=rect, label="RANDOM", action="random"))
+        # Presets sit on a fixed pitch, so hit-testing can index the row directly.
+        self._preset_row_rect = self.preset_buttons[0].rect.union(rect)
+        self._preset_pitch = preset_w + gap
 
         control_h = 46
         control_gap = 10
@@ -1075,37 +1703,89 @@ class StargateApp:
                 action="close",
             ),
         ]
+        self._control_row_rect = self.controls[0].rect.unionall([btn.rect for btn in self.controls[1:]])
 
     def run(self) -> None:
-        while self.running:
-            try:
-                dt = self.clock.tick(FPS) / 1000.0
-                self._handle_events()
+        # Anything unexpected still ends the run, but the guard sits outside the loop; only a
+        # pygame error while drawing is survivable, logged once per distinct message.
+        draw_error: Optional[str] = None
+        try:
+            while self.running:
+                rate = self._frame_rate()
+                woken_by = None
+                if rate != FPS:
+                    # Throttled (idle or hidden): sleep out the rest of the frame in the event
+                    # queue instead, so input or a restore wakes the loop at once rather than
+                    # on the next slow tick.
+                    spent = pygame.time.get_ticks() - self._frame_started_at
+                    woken_by = pygame.event.wait(max(1, 1000 // rate - spent))
+                    dt = self.clock.tick() / 1000.0
+                else:
+                    dt = self.clock.tick(rate) / 1000.0
+                self._frame_started_at = pygame.time.get_ticks()
+                self._handle_events(woken_by)
                 self._update(dt)
-                self._draw()
-                pygame.display.flip()
-            except Exception as exc:
-                self.logger.exception("Frame execution failed", exc)
-                self.status = f"Runtime error logged: {exc.__class__.__name__}"
-                self.running = False
+                # The idle scene animates continuously, so only skip frames nobody can see.
+                if pygame.display.get_active():
+                    try:
+                        self._draw()
+                        if self._present_rects is None:
+                            pygame.display.flip()
+                        elif self._present_rects:
+                            pygame.display.update(self._present_rects)
+                        draw_error = None
+                    except pygame.error as exc:
+                        if str(exc) != draw_error:
+                            draw_error = str(exc)
+                            self.logger.exception("Frame draw failed", exc)
+                else:
+                    # Present the whole window again once it is back on screen.
+                    self._present_key = None
+                if self.audio.preload_next():
+                    # The startup log only knew which files were queued; record what actually decoded.
+                    self.logger.info("Sounds loaded", **self.audio.sources(LOGGED_SOUNDS))
+        except Exception as exc:
+            self.logger.exception("Frame execution failed", exc)
+            self.status = f"Runtime error logged: {exc.__class__.__name__}"
+            self.running = False
         self.logger.info("Application shutting down")
         self.audio.stop_loop()
         pygame.quit()
 
-    def _handle_events(self) -> None:
-        for event in pygame.event.get():
+    def _frame_rate(self) -> int:
+        """Full rate while anything is happening; the untouched idle scene only drifts slowly."""
+        if self.state != "IDLE":
+            return FPS
+        if not pygame.display.get_active():
+            return HIDDEN_FPS
+        if pygame.time.get_ticks() - self.last_interaction_at > IDLE_THROTTLE_MS:
+            return IDLE_FPS
+        return FPS
+
+    def _handle_events(self, first: Optional[pygame.event.Event] = None) -> None:
+        # Motion and resizes are coalesced: only the last pointer position of the frame is
+        # hit-tested, and a window drag rebuilds the layout once per frame, not per event.
+        last_motion: Optional[Tuple[int, int]] = None
+        pending_size: Optional[Tuple[int, int]] = None
+        events = pygame.event.get()
+        if first is not None and first.type != pygame.NOEVENT:
+            # The event that ended an event.wait() sleep was queued before everything else.
+            events.insert(0, first)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.VIDEORESIZE:
-                self.screen = pygame.display.set_mode(event.size, pygame.RESIZABLE)
-                self._rebuild_layout()
-                self.settings["window_width"] = event.w
-                self.settings["window_height"] = event.h
-                save_settings(_runtime_dir(), self.settings)
-                self.logger.info("Window resized", width=event.w, height=event.h)
+                pending_size = event.size
             elif event.type == pygame.MOUSEMOTION:
-                self._handle_hover(event.pos)
+                last_motion = event.pos
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window contents were lost; present all of the next frame.
+                self._present_key = None
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                # A click must be resolved against the layout it was made on.
+                if pending_size is not None:
+                    self._apply_resize(pending_size)
+                    pending_size = None
                 self._handle_click(event.pos)
             elif event.type == pygame.KEYDOWN:
                 self._handle_key(event.key)
@@ -1114,6 +1794,19 @@ class StargateApp:
                     len(self.dial_log) - 1,
                     self.log_scroll - event.y,
                 ))
+        if pending_size is not None:
+            self._apply_resize(pending_size)
+        if last_motion is not None:
+            self._handle_hover(last_motion)
+
+    def _apply_resize(self, size: Tuple[int, int]) -> None:
+        if size == self._layout_size:
+            return
+        self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        self._rebuild_layout()
+        self.settings["window_width"], self.settings["window_height"] = size
+        save_settings(_runtime_dir(), self.settings)
+        self.logger.info("Window resized", width=size[0], height=size[1])
 
     def _wake_from_screensaver(self) -> None:
         if self.screensaver_active:
@@ -1125,17 +1818,37 @@ class StargateApp:
 
     def _handle_hover(self, pos: Tuple[int, int]) -> None:
         self.last_interaction_at = pygame.time.get_ticks()
+        self.hovered_button = self._button_at(pos)
         kind, idx = self.dhd.hit_test(pos)
+        self._dhd_hit = (pos, kind, idx)
         self.hovered_symbol = idx if kind == "symbol" else None
 
+    def _button_at(self, pos: Tuple[int, int]) -> Optional[Button]:
+        """Return the preset or control button under pos, if any."""
+        if self._preset_row_rect.collidepoint(pos):
+            col = (pos[0] - self._preset_row_rect.left) // self._preset_pitch
+            btn = self.preset_buttons[col]
+            return btn if btn.rect.collidepoint(pos) else None
+        if self._control_row_rect.collidepoint(pos):
+            for btn in self.controls:
+                if btn.rect.collidepoint(pos):
+                    return btn
+        return None
+
     def _handle_click(self, pos: Tuple[int, int]) -> None:
         self._wake_from_screensaver()
-        for btn in self.preset_buttons + self.controls:
-            if btn.rect.collidepoint(pos):
-                self._activate(btn)
-                return
+        # A click normally lands where the last motion event already hit-tested.
+        btn = self.hovered_button
+        if btn is None or not btn.rect.collidepoint(pos):
+            btn = self._button_at(pos)
+        if btn is not None:
+            self._activate(btn)
+            return
 
-        kind, idx = self.dhd.hit_test(pos)
+        if self._dhd_hit is not None and self._dhd_hit[0] == pos:
+            _, kind, idx = self._dhd_hit
+        else:
+            kind, idx = self.dhd.hit_test(pos)
         if kind == "symbol" and idx is not None:
             self._add_symbol(idx)
         elif kind == "center":
@@ -1168,10 +1881,10 @@ class StargateApp:
                 self.idc_mode = False
                 self.idc_entered = ""
         elif pygame.K_F1 <= key <= pygame.K_F4:
-            names = list(KNOWN_ADDRESSES.keys())
+            # The first preset buttons are the known addresses, in order.
             idx = key - pygame.K_F1
-            if idx < len(names):
-                self._load_preset(names[idx])
+            if idx < len(KNOWN_ADDRESSES):
+                self._activate(self.preset_buttons[idx])
 
     def _activate(self, btn: Button) -> None:
         if btn.action == "dial":
@@ -1198,25 +1911,39 @@ class StargateApp:
         if idx < 0 or idx >= SYMBOL_COUNT:
             return
         self.entered_symbols.append(idx)
+        self._rebuild_symbol_stage()
         self._spawn_dhd_ripple(idx)
         self.audio.play("press")
         self.status = f"Selected {len(self.entered_symbols)} symbols."
 
+    def _rebuild_symbol_stage(self) -> None:
+        """Refresh the DHD highlight stages by symbol index (1 = entered, 2 = locked); call after any address change."""
+        symbol_stage = bytearray(SYMBOL_COUNT)
+        for sym in self.entered_symbols:
+            symbol_stage[sym] = 1
+        for sym in self.current_address[: self.locked_count]:
+            symbol_stage[sym] = 2
+        self._symbol_stage = bytes(symbol_stage)
+        # Address-only ring stages, layered around the state-dependent ones by _gate_symbol_stages.
+        self._entered_stages = dict.fromkeys(self.entered_symbols, "selected")
+        if self.entered_symbols:
+            # Last entered symbol is treated as Point of Origin.
+            self._entered_stages[self.entered_symbols[-1]] = "poo"
+        self._locked_stages = dict.fromkeys(self.current_address[: self.locked_count], "locked")
+        # The console's address lines only change here too, so build them once rather than per frame.
+        self._glyph_string = "".join(self.glyph_chars[i] for i in self.entered_symbols)
+        parts = [f"{sym + 1:02d}" for sym in self.entered_symbols]
+        if parts:
+            parts[-1] += "(PoO)"
+        self._index_text = f"Glyphs: {' '.join(parts) if parts else '-'}"
+
     def _spawn_dhd_ripple(self, symbol_idx: Optional[int]) -> None:
         """Record a ripple originating from the given DHD symbol (or centre)."""
         now = pygame.time.get_ticks()
-        if symbol_idx is None:
+        if symbol_idx is None or not 0 <= symbol_idx < len(self.dhd.sector_centers):
             ox, oy = self.dhd.center
         else:
-            sector = next((s for s in self.dhd.sectors if s.index == symbol_idx), None)
-            if sector is None:
-                ox, oy = self.dhd.center
-            else:
-                mid_angle = (sector.start_angle + ((sector.end_angle - sector.start_angle) % 360.0) * 0.5) % 360.0
-                rad = math.radians(mid_angle)
-                mid_r = (sector.inner_radius + sector.outer_radius) * 0.5
-                ox = int(self.dhd.center[0] + math.sin(rad) * mid_r)
-                oy = int(self.dhd.center[1] - math.cos(rad) * mid_r)
+            ox, oy = self.dhd.sector_centers[symbol_idx]
         self.dhd_ripples.append((now, ox, oy))
         # Keep at most 6 active ripples.
         if len(self.dhd_ripples) > 6:
@@ -1227,6 +1954,7 @@ class StargateApp:
             return
         if self.entered_symbols:
             self.entered_symbols.pop()
+            self._rebuild_symbol_stage()
             self.audio.play("press")
             self.status = f"Selected {len(self.entered_symbols)} symbols."
 
@@ -1234,6 +1962,7 @@ class StargateApp:
         if self.state != "IDLE":
             return
         self.entered_symbols.clear()
+        self._rebuild_symbol_stage()
         self.audio.play("press")
         self.status = "Address cleared."
 
@@ -1241,7 +1970,8 @@ class StargateApp:
         if self.state != "IDLE":
             self.audio.play("error")
             return
-        self.entered_symbols = KNOWN_ADDRESSES[name].copy()
+        self.entered_symbols = list(KNOWN_ADDRESSES[name])
+        self._rebuild_symbol_stage()
         self.audio.play("press")
         self.status = f"Loaded preset: {name}."
         self.logger.info("Preset loaded", preset=name, symbols=len(self.entered_symbols))
@@ -1250,13 +1980,13 @@ class StargateApp:
         if self.state != "IDLE":
             self.audio.play("error")
             return
-        known_addrs = list(KNOWN_ADDRESSES.values())
         while True:
             symbols = random.sample(range(1, SYMBOL_COUNT), MIN_ADDRESS_LENGTH - 1)
             symbols.append(POINT_OF_ORIGIN)
-            if symbols not in known_addrs:
+            if tuple(symbols) not in KNOWN_ADDRESS_NAMES:
                 break
         self.entered_symbols = symbols
+        self._rebuild_symbol_stage()
         self.audio.play("press")
         self.status = "Random address loaded — destination UNKNOWN."
         self.logger.info("Random address loaded", symbols=symbols)
@@ -1271,6 +2001,7 @@ class StargateApp:
             return
         self.current_address = self.entered_symbols.copy()
         self.locked_count = 0
+        self._rebuild_symbol_stage()
         self.state = "DIALING"
         self.dial_step_index = 0
         self.dial_phase = "SPINUP"
@@ -1328,10 +2059,7 @@ class StargateApp:
         }
         label = state_labels.get(self.state, self.state)
         if self.state == "CONNECTED" and self.current_address:
-            dest = next(
-                (name for name, addr in KNOWN_ADDRESSES.items() if addr == self.current_address),
-                "Unknown",
-            )
+            dest = KNOWN_ADDRESS_NAMES.get(tuple(self.current_address), "Unknown")
             label = f"CONNECTED — {dest}"
         pygame.display.set_caption(f"Stargate Dialing Computer  |  {label}")
 
@@ -1344,6 +2072,7 @@ class StargateApp:
         self.locked_count = 0
         self.current_address.clear()
         self.entered_symbols.clear()
+        self._rebuild_symbol_stage()
         self.ring_angle = 0.0
         self.ring_target_angle = 0.0
         self.ring_speed = 0.0
@@ -1367,9 +2096,11 @@ class StargateApp:
         if self.dial_failed and now >= self.fail_flash_until:
             self.dial_failed = False
         # Screensaver: auto-dial random address after idle timeout.
-        idle_secs = float(self.settings.get("screensaver_idle_seconds", 60))
-        idle_elapsed = (now - self.last_interaction_at) / 1000.0
-        if not self.screensaver_active and idle_elapsed >= idle_secs and self.state == "IDLE":
+        if (
+            not self.screensaver_active
+            and now - self.last_interaction_at >= self.screensaver_idle_ms
+            and self.state == "IDLE"
+        ):
             self.screensaver_active = True
             self.logger.info("Screensaver activated")
         if self.screensaver_active:
@@ -1390,84 +2121,116 @@ class StargateApp:
             self.iris_angle = min(self.iris_target, self.iris_angle + iris_speed * dt)
         elif self.iris_angle > self.iris_target:
             self.iris_angle = max(self.iris_target, self.iris_angle - iris_speed * dt)
-        if self.state == "DIALING":
-            if self.dial_phase == "SPINUP":
-                # Free spin: accelerates to peak then decelerates before first symbol.
-                elapsed = now - (self.spinup_end_at - SPINUP_DURATION_MS)
-                t = min(1.0, elapsed / SPINUP_DURATION_MS)
-                # Bell curve speed — up then down.
-                spinup_speed = 320.0 * math.sin(t * math.pi)
-                self.ring_angle = (self.ring_angle + spinup_speed * dt) % 360.0
-                if now >= self.spinup_end_at:
-                    self.status = "Dialing sequence started."
-                    self._begin_next_dial_step()
-            elif self.dial_phase == "SPINNING":
-                delta = self.ring_target_angle - self.ring_angle
-                max_step = self.ring_speed * dt
-                if abs(delta) <= max_step:
-                    self.ring_angle = self.ring_target_angle
-                    self.dial_phase = "CHEVRON_ACTUATE"
-                    self.chevron_phase_started_at = now
-                    self.top_chevron_anim_until = now + CHEVRON_ACTUATE_MS
-                    self.status = f"Chevron {self.locked_count + 1} encoding..."
-                else:
-                    self.ring_angle += max_step if delta > 0 else -max_step
-            elif self.dial_phase == "CHEVRON_ACTUATE":
-                if now >= self.top_chevron_anim_until:
-                    self.locked_count += 1
-                    self.audio.play("lock")
-                    self.logger.info("Chevron locked", count=self.locked_count, total=len(self.current_address))
-                    if self.locked_count >= len(self.current_address):
-                        self._finish_dialing(now)
-                    else:
-                        self.dial_phase = "WAIT_NEXT"
-                        self.next_symbol_start_at = now + NEXT_SYMBOL_DELAY_MS
-                        self.status = (
-                            f"Chevron {self.locked_count} locked "
-                            f"of {len(self.current_address)}. Holding..."
-                        )
-            elif self.dial_phase == "WAIT_NEXT":
-                if now >= self.next_symbol_start_at:
-                    self.dial_step_index += 1
-                    self._begin_next_dial_step()
-        elif self.state == "OPENING":
-            if now >= self.open_finish_at:
-                self.state = "CONNECTED"
-                self.connected_since = now
-                self.status = "Wormhole established. Gate is active."
-                self._update_window_title()
-                self.audio.play("connected")
-                self.logger.info("Wormhole connected")
-                dest = next(
-                    (n for n, a in KNOWN_ADDRESSES.items() if a == self.current_address),
-                    "UNKNOWN",
-                )
-                self.dial_log.append({
-                    "time": datetime.now().strftime("%H:%M:%S"),
-                    "dest": dest,
-                    "result": "CONNECTED",
-                    "symbols": list(self.current_address),
-                })
-        elif self.state == "CONNECTED":
-            active_seconds = (now - self.connected_since) / 1000.0
-            remaining_seconds = MAX_WORMHOLE_DURATION_SECONDS - active_seconds
-            if remaining_seconds <= 0:
-                self._close_gate()
-                self.status = "Wormhole auto-closed at 38-minute safety limit."
-                self.logger.info(
-                    "Wormhole auto-closed at limit",
-                    limit_seconds=MAX_WORMHOLE_DURATION_SECONDS,
-                )
+        tick = self._state_ticks.get(self.state)
+        if tick is not None:
+            tick(now, dt)
+
+    def _tick_dialing(self, now: int, dt: float) -> None:
+        """Advance the ring and chevrons through the current dial phase."""
+        if self.dial_phase == "SPINUP":
+            # Free spin: accelerates to peak then decelerates before first symbol.
+            elapsed = now - (self.spinup_end_at - SPINUP_DURATION_MS)
+            t = min(1.0, elapsed / SPINUP_DURATION_MS)
+            # Bell curve speed — up then down.
+            spinup_speed = 320.0 * math.sin(t * math.pi)
+            self.ring_angle = (self.ring_angle + spinup_speed * dt) % 360.0
+            if now >= self.spinup_end_at:
+                self.status = "Dialing sequence started."
+                self._begin_next_dial_step()
+        elif self.dial_phase == "SPINNING":
+            delta = self.ring_target_angle - self.ring_angle
+            max_step = self.ring_speed * dt
+            if abs(delta) <= max_step:
+                self.ring_angle = self.ring_target_angle
+                self.dial_phase = "CHEVRON_ACTUATE"
+                self.chevron_phase_started_at = now
+                self.top_chevron_anim_until = now + CHEVRON_ACTUATE_MS
+                self.status = f"Chevron {self.locked_count + 1} encoding..."
             else:
-                mins = int(remaining_seconds) // 60
-                secs = int(remaining_seconds) % 60
+                self.ring_angle += max_step if delta > 0 else -max_step
+        elif self.dial_phase == "CHEVRON_ACTUATE":
+            if now >= self.top_chevron_anim_until:
+                self.locked_count += 1
+                self._rebuild_symbol_stage()
+                self.audio.play("lock")
+                self.logger.info("Chevron locked", count=self.locked_count, total=len(self.current_address))
+                if self.locked_count >= len(self.current_address):
+                    self._finish_dialing(now)
+                else:
+                    self.dial_phase = "WAIT_NEXT"
+                    self.next_symbol_start_at = now + NEXT_SYMBOL_DELAY_MS
+                    self.status = (
+                        f"Chevron {self.locked_count} locked "
+                        f"of {len(self.current_address)}. Holding..."
+                    )
+        elif self.dial_phase == "WAIT_NEXT":
+            if now >= self.next_symbol_start_at:
+                self.dial_step_index += 1
+                self._begin_next_dial_step()
+
+    def _tick_opening(self, now: int, dt: float) -> None:
+        """Settle the kawoosh into an established wormhole."""
+        if now >= self.open_finish_at:
+            self.state = "CONNECTED"
+            self.connected_since = now
+            self._status_tenths = -1
+            self.status = "Wormhole established. Gate is active."
+            self._update_window_title()
+            self.audio.play("connected")
+            self.logger.info("Wormhole connected")
+            dest = KNOWN_ADDRESS_NAMES.get(tuple(self.current_address), "UNKNOWN")
+            self.dial_log.append({
+                "time": datetime.now().strftime("%H:%M:%S"),
+                "dest": dest,
+                "result": "CONNECTED",
+                "symbols": list(self.current_address),
+            })
+
+    def _tick_connected(self, now: int, dt: float) -> None:
+        """Refresh the connection timer readout and enforce the safety limit."""
+        active_seconds = (now - self.connected_since) / 1000.0
+        remaining_seconds = MAX_WORMHOLE_DURATION_SECONDS - active_seconds
+        if remaining_seconds <= 0:
+            self._close_gate()
+            self.status = "Wormhole auto-closed at 38-minute safety limit."
+            self.logger.info(
+                "Wormhole auto-closed at limit",
+                limit_seconds=MAX_WORMHOLE_DURATION_SECONDS,
+            )
+        else:
+            # The readout only shows tenths, so rebuild the status string when they tick over.
+            tenths = (now - self.connected_since) // 100
+            if tenths != self._status_tenths:
+                self._status_tenths = tenths
+                remaining_display = MAX_WORMHOLE_DURATION_SECONDS - tenths / 10.0
+                mins = int(remaining_display) // 60
+                secs = int(remaining_display) % 60
                 self.status = (
-                    f"Wormhole active — {active_seconds:04.1f}s elapsed. "
+                    f"Wormhole active — {tenths / 10.0:04.1f}s elapsed. "
                     f"Auto-close in {mins:02d}:{secs:02d}."
                 )
 
     def _draw(self) -> None:
-        now = pygame.time.get_ticks() / 1000.0
+        # Sample the clock once; every layer animates from the same frame time.
+        self._frame_ticks = pygame.time.get_ticks()
+        now = self._frame_ticks / 1000.0
+        # An IDLE frame with no overlays, ripples or hover change only moves the stars and the
+        # DHD centre glow; the draw steps add those areas, or fall back to the whole window.
+        present_key = (
+            self.state,
+            self.screen.get_size(),
+            self.hovered_button,
+            self.dial_failed,
+            self.show_log,
+            self.idc_mode,
+            self.screensaver_active,
+            bool(self.dhd_ripples),
+        )
+        quiet = self.state == "IDLE" and not (
+            self.dial_failed or self.show_log or self.idc_mode or self.screensaver_active or self.dhd_ripples
+        )
+        self._present_rects = [] if quiet and present_key == self._present_key else None
+        self._present_key = present_key
         self._draw_background(now)
         self._draw_stargate(now)
         self._draw_console(now)
@@ -1485,7 +2248,7 @@ class StargateApp:
         """Red pulsing border + countdown banner when < 5 minutes remain."""
         if self.state != "CONNECTED":
             return
-        remaining = MAX_WORMHOLE_DURATION_SECONDS - (pygame.time.get_ticks() - self.connected_since) / 1000.0
+        remaining = MAX_WORMHOLE_DURATION_SECONDS - (self._frame_ticks - self.connected_since) / 1000.0
         if remaining > 300:
             return
         w, h = self.screen.get_size()
@@ -1494,17 +2257,31 @@ class StargateApp:
         freq = 1.0 + urgency * 3.0
         pulse = 0.5 + 0.5 * math.sin(now * freq * 2 * math.pi)
         border_alpha = int(180 * pulse)
-        border_w = max(4, int(14 * urgency))
-
-        border_surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        pygame.draw.rect(border_surf, (220, 30, 30, border_alpha), (0, 0, w, h), border_w)
-        self.screen.blit(border_surf, (0, 0))
+        border_w = max(4, int(WARNING_BORDER_MAX * urgency))
+
+        # The border is four flat strips, cut from two opaque red bands faded by surface alpha
+        # rather than a full-window SRCALPHA surface allocated every frame.
+        strips = self._warning_strips
+        if strips is None or (strips[0].get_width(), strips[1].get_height()) != (w, h):
+            across = pygame.Surface((w, WARNING_BORDER_MAX)).convert()
+            down = pygame.Surface((WARNING_BORDER_MAX, h)).convert()
+            across.fill((220, 30, 30))
+            down.fill((220, 30, 30))
+            strips = self._warning_strips = (across, down)
+        across, down = strips
+        across.set_alpha(border_alpha)
+        down.set_alpha(border_alpha)
+        self.screen.blit(across, (0, 0), (0, 0, w, border_w))
+        self.screen.blit(across, (0, h - border_w), (0, 0, w, border_w))
+        self.screen.blit(down, (0, border_w), (0, 0, border_w, h - 2 * border_w))
+        self.screen.blit(down, (w - border_w, border_w), (0, 0, border_w, h - 2 * border_w))
 
         # Warning banner along the top of the gate view.
         mins = int(remaining) // 60
         secs = int(remaining) % 60
         warn_text = f"WARNING — AUTO-CLOSE IN  {mins:02d}:{secs:02d}"
-        warn_surf = self.font_md.render(warn_text, True, (255, int(60 + 60 * pulse), 40))
+        # Step the pulsing green channel so the banner reuses a handful of cached renders per second.
+        warn_surf = self._text(self.font_md, warn_text, (255, 60 + 12 * round(5 * pulse), 40))
         banner_alpha = int(220 * (0.6 + 0.4 * pulse))
         warn_bg = pygame.Surface((warn_surf.get_width() + 28, warn_surf.get_height() + 10), pygame.SRCALPHA)
         warn_bg.fill((30, 0, 0, banner_alpha))
@@ -1517,7 +2294,7 @@ class StargateApp:
         alpha = int(120 + 60 * math.sin(now * 0.8))
         surf = pygame.Surface((220, 32), pygame.SRCALPHA)
         surf.fill((0, 0, 0, 100))
-        label = self.font_sm.render("SCREENSAVER  (any key to wake)", True, (180, 200, 220))
+        label = self._text(self.font_sm, "SCREENSAVER  (any key to wake)", (180, 200, 220))
         surf.blit(label, (8, 6))
         surf.set_alpha(alpha)
         w, h = self.screen.get_size()
@@ -1553,20 +2330,24 @@ class StargateApp:
         color_r = int(180 * (1.0 - ease * 0.7))
         color_g = int(220 * (1.0 - ease * 0.5))
 
-        surf = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
         # Draw as an ellipse with compressed Y.
         ry = max(1, int(ring_r * y_scale))
         rect = pygame.Rect(cx - ring_r, cy - ry, ring_r * 2, ry * 2)
-        pygame.draw.ellipse(surf, (color_r, color_g, color_b, alpha), rect, ring_w)
         # Secondary halo ring slightly larger.
         halo_rect = rect.inflate(ring_w * 4, int(ring_w * 4 * y_scale))
-        pygame.draw.ellipse(surf, (color_r, color_g, color_b, alpha // 3), halo_rect, max(1, ring_w // 2))
-        self.screen.blit(surf, (0, 0))
+        # Blend through a layer covering just the two rings, not the whole window.
+        bounds = rect.union(halo_rect)
+        surf = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        pygame.draw.ellipse(surf, (color_r, color_g, color_b, alpha), rect.move(-bounds.x, -bounds.y), ring_w)
+        pygame.draw.ellipse(
+            surf, (color_r, color_g, color_b, alpha // 3), halo_rect.move(-bounds.x, -bounds.y), max(1, ring_w // 2)
+        )
+        self.screen.blit(surf, bounds.topleft)
 
     def _draw_idc_prompt(self) -> None:
         """Small banner below the gate prompting for IDC digits."""
         text = f"IDC: {self.idc_entered}{'_' * (3 - len(self.idc_entered))}   (Esc to cancel)"
-        surf = self.font_md.render(text, True, (255, 220, 80))
+        surf = self._text(self.font_md, text, (255, 220, 80))
         w = surf.get_width() + 28
         h = surf.get_height() + 14
         bx = self.left_view_rect.centerx - w // 2
@@ -1592,11 +2373,11 @@ class StargateApp:
         pygame.draw.rect(bg, (60, 90, 130, 180), (0, 0, log_w, panel_h), 2)
         self.screen.blit(bg, (lx, ly))
 
-        header = self.font_md.render("DIAL LOG  (Tab to close, scroll to browse)", True, (140, 200, 255))
+        header = self._text(self.font_md, "DIAL LOG  (Tab to close, scroll to browse)", (140, 200, 255))
         self.screen.blit(header, (lx + 10, ly + 8))
 
         if not self.dial_log:
-            no_data = self.font_sm.render("No dials recorded yet.", True, (120, 140, 160))
+            no_data = self._text(self.font_sm, "No dials recorded yet.", (120, 140, 160))
             self.screen.blit(no_data, (lx + 10, ly + row_h + 14))
             return
 
@@ -1611,13 +2392,15 @@ class StargateApp:
                 f"{entry['time']}  {entry['dest']:10s}  [{entry['result']}]  {syms}",
                 log_w - 20,
             )
-            self.screen.blit(self.font_sm.render(line, True, result_col), (lx + 10, ey))
+            self.screen.blit(self._text(self.font_sm, line, result_col), (lx + 10, ey))
 
     def _draw_dhd_ripples(self, now: float) -> None:
         """Expanding translucent rings radiating from DHD button press positions."""
         RIPPLE_DURATION_MS = 700
-        now_ms = pygame.time.get_ticks()
-        ripple_surf = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        if not self.dhd_ripples:
+            return
+        now_ms = self._frame_ticks
+        rings = []
         alive = []
         for spawn_ms, ox, oy in self.dhd_ripples:
             elapsed = now_ms - spawn_ms
@@ -1628,26 +2411,44 @@ class StargateApp:
             r = int(self.dhd.outer_radius * 0.85 * t)
             alpha = int(180 * (1.0 - t) ** 1.4)
             width = max(1, int(4 * (1.0 - t)))
-            pygame.draw.circle(ripple_surf, (255, 210, 120, alpha), (ox, oy), r, width)
+            rings.append((ox, oy, r, alpha, width))
         self.dhd_ripples[:] = alive
-        self.screen.blit(ripple_surf, (0, 0))
+        if not rings:
+            return
+        # Blend the rings through a layer covering just their bounds, not the whole window.
+        ring_rects = [pygame.Rect(ox - r, oy - r, 2 * r + 1, 2 * r + 1) for ox, oy, r, _, _ in rings]
+        bounds = ring_rects[0].unionall(ring_rects[1:])
+        layer = self._ripple_layer
+        if layer is None or not layer.get_rect().contains(pygame.Rect((0, 0), bounds.size)):
+            held = layer.get_size() if layer else (0, 0)
+            size = (max(bounds.width, held[0]), max(bounds.height, held[1]))
+            layer = self._ripple_layer = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        area = pygame.Rect((0, 0), bounds.size)
+        layer.fill((0, 0, 0, 0), area)
+        for ox, oy, r, alpha, width in rings:
+            pygame.draw.circle(layer, (255, 210, 120, alpha), (ox - bounds.x, oy - bounds.y), r, width)
+        self.screen.blit(layer, bounds.topleft, area)
 
     def _draw_fail_flash(self, now: float) -> None:
         """Full-screen red flash + LOCK FAILURE banner after a dialing failure."""
         if not self.dial_failed:
             return
-        ticks = pygame.time.get_ticks()
+        ticks = self._frame_ticks
         elapsed = ticks - (self.fail_flash_until - DIAL_FAIL_FLASH_MS)
         progress = min(1.0, elapsed / DIAL_FAIL_FLASH_MS)
         # Sharp flash at start, fades out.
         alpha = int(200 * (1.0 - progress) ** 1.5 * (0.5 + 0.5 * math.sin(now * 18)))
-        w, h = self.screen.get_size()
-        flash = pygame.Surface((w, h), pygame.SRCALPHA)
-        flash.fill((200, 10, 10, max(0, alpha)))
+        # The flash is one flat colour, so an opaque display-format surface with a surface
+        # alpha blends the same without a per-pixel alpha channel or a per-frame allocation.
+        flash = self._fail_flash_layer
+        if flash is None or flash.get_size() != self.screen.get_size():
+            flash = self._fail_flash_layer = pygame.Surface(self.screen.get_size()).convert()
+            flash.fill((200, 10, 10))
+        flash.set_alpha(max(0, alpha))
         self.screen.blit(flash, (0, 0))
 
         if progress < 0.75:
-            label = self.font_lg.render("LOCK FAILURE", True, (255, 80, 60))
+            label = self._text(self.font_lg, "LOCK FAILURE", (255, 80, 60))
             lx = self.left_view_rect.centerx - label.get_width() // 2
             ly = self.gate_center[1] - label.get_height() // 2
             bg = pygame.Surface((label.get_width() + 24, label.get_height() + 12), pygame.SRCALPHA)
@@ -1657,60 +2458,84 @@ class StargateApp:
 
     def _draw_background(self, now: float) -> None:
         width, height = self.screen.get_size()
-        h = height
-        for y in range(h):
-            blend = y / h
-            r = int(6 + 18 * blend)
-            g = int(10 + 19 * blend)
-            b = int(26 + 26 * blend)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (width, y))
-
         # Nebulas drift slowly on their own parallax layer.
         idle_w = 1.0 if self.state == "IDLE" else 0.15
         neb_pan_x = math.sin(now * 0.04) * width * 0.012 * idle_w
         neb_pan_y = math.cos(now * 0.03) * height * 0.008 * idle_w
-        nebula = pygame.Surface((width, height), pygame.SRCALPHA)
-        for base_cx, base_cy, radius, phase in (
-            (int(width * 0.16), int(height * 0.18), int(height * 0.30), 0.7),
-            (int(width * 0.40), int(height * 0.74), int(height * 0.38), 1.2),
-            (int(width * 0.84), int(height * 0.18), int(height * 0.29), 0.4),
-        ):
-            ncx = int(base_cx + neb_pan_x)
-            ncy = int(base_cy + neb_pan_y)
-            glow = 30 + int(18 * (1 + math.sin(now + phase)))
-            pygame.draw.circle(nebula, (26, 62, 112, glow), (ncx, ncy), radius)
-        self.screen.blit(nebula, (0, 0))
-
-        # Perspective floor plane for depth.
-        floor = pygame.Surface((width, height), pygame.SRCALPHA)
-        horizon_y = int(height * 0.62)
-        floor_poly = [(0, height), (width, height), (int(width * 0.58), horizon_y), (int(width * 0.08), horizon_y)]
-        pygame.draw.polygon(floor, (8, 14, 24, 122), floor_poly)
-        for i in range(11):
-            t = (i + 1) / 12.0
-            y = int(horizon_y + (height - horizon_y) * (t * t))
-            alpha = int(22 + 48 * (1.0 - t))
-            pygame.draw.line(floor, (44, 74, 106, alpha), (0, y), (width, y), 1)
-        vanishing_x = int(width * 0.33)
-        for i in range(-6, 7):
-            px = int(vanishing_x + i * width * 0.09)
-            pygame.draw.line(floor, (36, 62, 92, 34), (px, height), (vanishing_x, horizon_y), 1)
-        self.screen.blit(floor, (0, 0))
+        nebulas = tuple(
+            (
+                int(base_cx + neb_pan_x),
+                int(base_cy + neb_pan_y),
+                (30 + int(18 * (1 + math.sin(now + phase)))) // NEBULA_GLOW_STEP * NEBULA_GLOW_STEP,
+            )
+            for _, base_cx, base_cy, _, phase in self._nebula_sprites
+        )
+        if nebulas != self._sky_key:
+            self._sky_key = nebulas
+            self._present_rects = None
+            sky = self._sky_layer
+            sky.blit(self._background_gradient, (0, 0))
+            for (sprite, _, _, radius, _), (ncx, ncy, glow) in zip(self._nebula_sprites, nebulas):
+                # The sprite is fully opaque, so the surface alpha alone sets the glow.
+                sprite.set_alpha(glow)
+                sky.blit(sprite, (ncx - radius - 1, ncy - radius - 1))
+            # Perspective floor plane for depth, baked in so the frame only pays one opaque blit.
+            sky.blit(self._background_floor, (0, self._background_floor_y))
+            # The gate view frame is opaque and static, so it lives on this layer too; stars
+            # behind it are masked out below.
+            pygame.draw.rect(sky, (16, 21, 29), self._gate_frame_rect, border_radius=16)
+            pygame.draw.rect(sky, (44, 56, 72), self._gate_frame_rect, width=2, border_radius=16)
+        self.screen.blit(self._sky_layer, (0, 0))
 
         # Camera pan: slow sinusoidal drift that pauses during active dialing.
         idle_weight = 1.0 if self.state == "IDLE" else 0.15
         pan_x = math.sin(now * 0.07) * width * 0.018 * idle_weight
         pan_y = math.cos(now * 0.05) * height * 0.010 * idle_weight
 
-        for x, y, size, phase in self.stars:
-            twinkle = 130 + int(120 * (0.5 + 0.5 * math.sin(now * 1.4 + phase)))
-            color = (twinkle, twinkle, 255)
-            # Horizontal drift + parallax pan (deeper stars move less).
-            parallax = size / 3.0  # small stars are "farther away"
-            px = int((x + now * (2 + size * 0.9) + phase * 8 + pan_x * parallax) % width)
-            raw_py = y + pan_y * parallax
-            py = int(raw_py) if raw_py < height * 0.66 else int(height * 0.66 + (y % max(1, int(height * 0.34))))
-            pygame.draw.circle(self.screen, color, (px, py), size)
+        x, y, parallax = self._star_x, self._star_y, self._star_parallax
+        twinkle = 130 + (120 * (0.5 + 0.5 * np.sin(now * 1.4 + self._star_phase))).astype(np.uint32)
+        # Horizontal drift + parallax pan (deeper stars move less).
+        px = ((x + now * self._star_drift + self._star_phase_offset + pan_x * parallax) % width).astype(np.int32)
+        raw_py = y + pan_y * parallax
+        py = np.where(raw_py < height * 0.66, raw_py, height * 0.66 + (y % max(1, int(height * 0.34)))).astype(np.int32)
+        if self.state == "IDLE":
+            # Squares the stars cover now; with last frame's, that is all a quiet frame changes.
+            radius = self._star_radius
+            star_rects = [
+                pygame.Rect(left, top, span, span)
+                for left, top, span in zip((px - radius).tolist(), (py - radius).tolist(), (2 * radius + 1).tolist())
+            ]
+            if self._present_rects is not None:
+                self._present_rects += self._star_rects
+                self._present_rects += star_rects
+            self._star_rects = star_rects
+
+        # Stamp every star pixel straight into the screen instead of one draw.circle per star.
+        idx = self._star_stamp_idx
+        sx = px[idx] + self._star_stamp_dx
+        sy = py[idx] + self._star_stamp_dy
+        visible = (sx >= 0) & (sx < width) & (sy >= 0) & (sy < height)
+        idx, sx, sy = idx[visible], sx[visible], sy[visible]
+        # Stars behind the gate frame used to be painted over straight away; skip them.
+        open_sky = self._star_open[sx, sy]
+        idx, sx, sy = idx[open_sky], sx[open_sky], sy[open_sky]
+        screen = self.screen
+        if screen.get_bytesize() == 3:
+            # 24-bit displays have no 2D pixel view; write the channels (twinkle in red/green,
+            # blue at full brightness) separately.
+            pixels = pygame.surfarray.pixels3d(screen)
+            star_twinkle = twinkle[idx]
+            pixels[sx, sy, 0] = star_twinkle
+            pixels[sx, sy, 1] = star_twinkle
+            pixels[sx, sy, 2] = 255
+        else:
+            # Star colours packed in the screen's pixel format, so each stamped pixel is a single store.
+            r_shift, g_shift, _, _ = screen.get_shifts()
+            r_loss, g_loss, _, _ = screen.get_losses()
+            colors = ((twinkle >> r_loss) << r_shift) | ((twinkle >> g_loss) << g_shift) | screen.map_rgb((0, 0, 255))
+            pixels = pygame.surfarray.pixels2d(screen)
+            pixels[sx, sy] = colors[idx]
+        del pixels
 
     def _draw_stargate(self, now: float) -> None:
         center = self.gate_center
@@ -1718,135 +2543,158 @@ class StargateApp:
         ring_radius = self.gate_ring_radius
         inner_radius = self.gate_inner_radius
 
-        frame_rect = pygame.Rect(
-            self.left_view_rect.left + 6,
-            self.left_view_rect.top + 6,
-            self.left_view_rect.width - 12,
-            self.left_view_rect.height - 12,
-        )
-        pygame.draw.rect(self.screen, (16, 21, 29), frame_rect, border_radius=16)
-        pygame.draw.rect(self.screen, (44, 56, 72), frame_rect, width=2, border_radius=16)
-
-        # Ground shadow under the gate to anchor it in space.
-        shadow = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        shadow_rect = pygame.Rect(0, 0, int(outer_radius * 2.2), int(outer_radius * 0.55))
-        shadow_rect.center = (center[0], int(center[1] + outer_radius * 1.02))
-        pygame.draw.ellipse(shadow, (0, 0, 0, 125), shadow_rect)
-        pygame.draw.ellipse(shadow, (14, 26, 40, 68), shadow_rect.inflate(-24, -10))
-        self.screen.blit(shadow, (0, 0))
+        # The view frame itself is baked into the sky layer (see _draw_background).
+        # Ground shadow under the gate to anchor it in space; it can spill past the frame onto
+        # the stars, so it stays a per-frame blit.
+        self.screen.blit(self._gate_shadow, self._gate_shadow_pos)
+
+        side_offset = (int(outer_radius * 0.06), int(outer_radius * 0.07))
+        stages = self._gate_symbol_stages()
+        gate_key = self._gate_sprite_key(stages, now)
+        if gate_key is not None and gate_key == self._gate_sprite_key_drawn:
+            # Nothing on the gate has changed: reuse the finished sprites instead of re-rendering.
+            side, gate_tilt = self._gate_side_sprite, self._gate_sprite
+            self.screen.blit(side, side.get_rect(center=(center[0] + side_offset[0], center[1] + side_offset[1])))
+            self.screen.blit(gate_tilt, gate_tilt.get_rect(center=center))
+            return
 
+        self._present_rects = None
         # Render gate to local layer, then apply perspective compression for pseudo-3D.
         pad = outer_radius + 70
-        layer_size = pad * 2
-        gate_layer = pygame.Surface((layer_size, layer_size), pygame.SRCALPHA)
+        # Start from the cached static gate body; only dynamic parts are drawn per frame.
+        gate_layer = self._gate_static_layer.copy()
         local_center = (pad, pad)
 
-        pygame.draw.circle(gate_layer, (122, 128, 138), local_center, outer_radius)
-        pygame.draw.circle(gate_layer, (74, 81, 91), local_center, outer_radius - 16)
-        pygame.draw.circle(gate_layer, (142, 148, 158), local_center, ring_radius + 14, 24)
-        pygame.draw.circle(gate_layer, (25, 33, 43), local_center, inner_radius)
-
-        # Metallic bevel highlights and shadows.
-        outer_highlight = pygame.Rect(
-            local_center[0] - outer_radius,
-            local_center[1] - outer_radius,
-            outer_radius * 2,
-            outer_radius * 2,
-        )
-        pygame.draw.arc(gate_layer, (236, 242, 255, 80), outer_highlight, math.radians(210), math.radians(330), 6)
-        pygame.draw.arc(gate_layer, (10, 14, 20, 120), outer_highlight, math.radians(30), math.radians(140), 10)
-        ring_rect = pygame.Rect(local_center[0] - ring_radius, local_center[1] - ring_radius, ring_radius * 2, ring_radius * 2)
-        pygame.draw.arc(gate_layer, (225, 234, 248, 70), ring_rect, math.radians(195), math.radians(315), 4)
-        pygame.draw.arc(gate_layer, (5, 9, 15, 130), ring_rect, math.radians(8), math.radians(132), 6)
-
-        self._draw_ring_symbols(gate_layer, local_center, ring_radius, self.ring_angle, now)
+        self._draw_ring_symbols(gate_layer, local_center, ring_radius, self.ring_angle, now, stages)
         self._draw_chevrons(gate_layer, local_center, outer_radius - 20, now)
 
         if self.state in {"OPENING", "CONNECTED"}:
             # Blue ambient glow around the inner opening of the gate.
-            glow_surf = pygame.Surface((layer_size, layer_size), pygame.SRCALPHA)
             glow_pulse = 0.5 + 0.5 * math.sin(now * 2.2)
             glow_spread = int(inner_radius * 0.14) + int(10 * glow_pulse)
-            for gl in range(glow_spread, 0, -2):
-                a = int(60 * (1.0 - gl / glow_spread) * (0.7 + 0.3 * glow_pulse))
-                pygame.draw.circle(glow_surf, (28, 108, 230, max(0, a)), local_center, inner_radius + gl, 2)
-            gate_layer.blit(glow_surf, (0, 0))
+            glow_ring = self._inner_glow_ring(inner_radius, glow_spread)
+            # The pulse scales every band's alpha equally, so it is applied as surface alpha.
+            glow_ring.set_alpha(int(255 * (0.7 + 0.3 * glow_pulse)))
+            gate_layer.blit(glow_ring, (pad - inner_radius - glow_spread, pad - inner_radius - glow_spread))
             self._draw_wormhole(gate_layer, local_center, inner_radius - 2, now)
 
         if self.iris_angle > 0.005:
             self._draw_iris(gate_layer, local_center, inner_radius - 2, self.iris_angle, now)
 
-        tilt_factor = 0.84
-        tilt_size = (layer_size, max(1, int(layer_size * tilt_factor)))
-        gate_tilt = pygame.transform.smoothscale(gate_layer, tilt_size)
+        gate_tilt = pygame.transform.smoothscale(gate_layer, self._gate_tilt_size)
 
         # Side thickness pass.
         side = gate_tilt.copy()
-        side.fill((45, 48, 55, 255), special_flags=pygame.BLEND_RGBA_MULT)
-        side_rect = side.get_rect(center=(center[0] + int(outer_radius * 0.06), center[1] + int(outer_radius * 0.07)))
+        side.blit(self._gate_side_tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        side_rect = side.get_rect(center=(center[0] + side_offset[0], center[1] + side_offset[1]))
         self.screen.blit(side, side_rect)
 
         gate_rect = gate_tilt.get_rect(center=center)
         self.screen.blit(gate_tilt, gate_rect)
+        self._gate_sprite = gate_tilt
+        self._gate_side_sprite = side
+        self._gate_sprite_key_drawn = gate_key
+
+    def _gate_sprite_key(self, stages: Dict[int, str], now: float) -> Optional[Tuple]:
+        """Everything the finished gate sprite depends on, or None while part of it animates."""
+        if self.state in {"OPENING", "CONNECTED"}:
+            return None
+        if self.state == "DIALING" and self.dial_phase == "CHEVRON_ACTUATE":
+            return None
+        # The pulsing ring glyphs only change colour when their stepped brightness does.
+        pulse_steps = self._ring_pulse_steps(now) if "active" in stages.values() or "poo" in stages.values() else None
+        # The IDC prompt is drawn onto a nearly closed iris (see _draw_iris).
+        idc_text = self.idc_entered if self.idc_mode and self.iris_angle > 0.90 else None
+        return (self.ring_angle, self.iris_angle, self.locked_count, tuple(stages.items()), pulse_steps, idc_text)
+
+    @staticmethod
+    def _ring_pulse_steps(now: float) -> Tuple[int, int]:
+        """Stepped brightness of the active-symbol and point-of-origin glyph pulses."""
+        return (
+            int((0.5 + 0.5 * math.sin(now * 10.0)) * RING_PULSE_LEVELS),
+            int((0.5 + 0.5 * math.sin(now * 3.0)) * RING_PULSE_LEVELS),
+        )
 
     def _draw_ring_symbols(
-        self, target: pygame.Surface, center: Tuple[int, int], radius: int, extra_angle: float, now: float
+        self,
+        target: pygame.Surface,
+        center: Tuple[int, int],
+        radius: int,
+        extra_angle: float,
+        now: float,
+        stages: Dict[int, str],
     ) -> None:
         self._ensure_gate_glyph_font(int(radius * 0.11))
         cx, cy = center
+        rad = math.radians(extra_angle)
+        rot_cos = math.cos(rad)
+        rot_sin = math.sin(rad)
+        xs = (cx + radius * (self._ring_unit_cos * rot_cos - self._ring_unit_sin * rot_sin)).astype(np.int32).tolist()
+        ys = (cy + radius * (self._ring_unit_sin * rot_cos + self._ring_unit_cos * rot_sin)).astype(np.int32).tolist()
+        # Colours per stage for this frame; only the pulsing ones depend on time.
+        pulse_step, poo_step = self._ring_pulse_steps(now)
+        pulse = pulse_step / RING_PULSE_LEVELS
+        # Point of Origin — distinctive green/gold
+        poo_pulse = poo_step / RING_PULSE_LEVELS
+        stage_colors = {
+            "locked": (255, 176, 92),
+            "active": (int(190 + 65 * pulse), int(220 + 25 * pulse), 255),
+            "poo": (int(100 + 60 * poo_pulse), 240, int(80 + 40 * poo_pulse)),
+            "poo_idle": (90, 200, 80),
+            "selected": (170, 205, 244),
+            "idle": (170, 178, 191),
+        }
+        # Shadow, glyph and glow for every symbol go to SDL as one batch, in draw order.
+        sequence: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
         for i in range(SYMBOL_COUNT):
-            base = i * (360.0 / SYMBOL_COUNT) + extra_angle
-            rad = math.radians(base)
-            x = cx + math.cos(rad) * radius
-            y = cy + math.sin(rad) * radius
-            px, py = int(x), int(y)
-
-            stage = self._gate_symbol_stage(i)
-            if stage == "locked":
-                col = (255, 176, 92)
-            elif stage == "active":
-                pulse = 0.5 + 0.5 * math.sin(now * 10.0)
-                col = (int(190 + 65 * pulse), int(220 + 25 * pulse), 255)
-            elif stage == "poo":
-                # Point of Origin — distinctive green/gold
-                poo_pulse = 0.5 + 0.5 * math.sin(now * 3.0)
-                col = (int(100 + 60 * poo_pulse), 240, int(80 + 40 * poo_pulse))
-            elif stage == "poo_idle":
-                col = (90, 200, 80)
-            elif stage == "selected":
-                col = (170, 205, 244)
-            else:
-                col = (170, 178, 191)
+            px, py = xs[i], ys[i]
 
-            glyph_char = self.glyph_chars[i] if i < len(self.glyph_chars) else "?"
-            text_surface = self._render_text_safe(
-                self.gate_glyph_font,
-                glyph_char,
-                col,
-                fallback_text=f"{i + 1:02d}",
-                fallback_font=self.font_sm,
-            )
-            shadow_surface = self._render_text_safe(
+            stage = stages.get(i, "idle")
+            col = stage_colors[stage]
+
+            text_surface = self._ring_glyph(i, col)
+            shadow_surface = self._ring_glyph(i, (8, 10, 14))
+            rect = text_surface.get_rect(center=(px, py))
+            sequence.append((shadow_surface, (rect.x + 1, rect.y + 2)))
+            sequence.append((text_surface, rect.topleft))
+
+            glow = self._ring_glow_sprites.get(stage)
+            if glow is not None:
+                sequence.append((glow, (px - 12, py - 12)))
+        target.blits(sequence, doreturn=False)
+
+    def _ring_glyph(self, index: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Rendered ring glyph, cached per font/colour so the rotating ring never re-rasterises text."""
+        key = (self.gate_glyph_font, index, color)
+        # Least recently used first: pulsing colours age out while the idle ring stays resident.
+        surface = self._ring_glyph_cache.pop(key, None)
+        if surface is None:
+            if len(self._ring_glyph_cache) >= TEXT_CACHE_LIMIT:
+                del self._ring_glyph_cache[next(iter(self._ring_glyph_cache))]
+            glyph_char = self.glyph_chars[index] if index < len(self.glyph_chars) else "?"
+            surface = self._render_text_safe(
                 self.gate_glyph_font,
                 glyph_char,
-                (8, 10, 14),
-                fallback_text=f"{i + 1:02d}",
+                color,
+                fallback_text=f"{index + 1:02d}",
                 fallback_font=self.font_sm,
             )
-            rect = text_surface.get_rect(center=(px, py))
-            target.blit(shadow_surface, rect.move(1, 2))
-            target.blit(text_surface, rect)
-
-            if stage in {"locked", "active", "poo", "poo_idle"}:
-                glow = pygame.Surface((24, 24), pygame.SRCALPHA)
-                if stage == "poo":
-                    pygame.draw.circle(glow, (80, 255, 80, 110), (12, 12), 10)
-                elif stage == "poo_idle":
-                    pygame.draw.circle(glow, (60, 180, 60, 55), (12, 12), 10)
-                else:
-                    glow_alpha = 80 if stage == "locked" else 130
-                    pygame.draw.circle(glow, (255, 196, 126, glow_alpha), (12, 12), 10)
-                target.blit(glow, (px - 12, py - 12))
+        self._ring_glyph_cache[key] = surface
+        return surface
+
+    @staticmethod
+    def _build_ring_glow_sprites() -> Dict[str, pygame.Surface]:
+        glows: Dict[str, pygame.Surface] = {}
+        for stage, color in (
+            ("locked", (255, 196, 126, 80)),
+            ("active", (255, 196, 126, 130)),
+            ("poo", (80, 255, 80, 110)),
+            ("poo_idle", (60, 180, 60, 55)),
+        ):
+            glow = pygame.Surface((24, 24), pygame.SRCALPHA)
+            pygame.draw.circle(glow, color, (12, 12), 10)
+            glows[stage] = glow.convert_alpha()
+        return glows
 
     def _draw_chevrons(self, target: pygame.Surface, center: Tuple[int, int], radius: int, now: float) -> None:
         cx, cy = center
@@ -1860,47 +2708,26 @@ class StargateApp:
 
         # Which chevron position is currently encoding (about to lock).
         actuating_pos = CHEVRON_LOCK_ORDER[min(self.locked_count, chevron_count - 1)]
-        locked_positions = set(CHEVRON_LOCK_ORDER[: self.locked_count])
+        locked_positions = CHEVRON_LOCKED_SETS[min(self.locked_count, len(CHEVRON_LOCK_ORDER))]
 
         half_w = int(radius * 0.118)   # half-width of chevron base
-        depth = int(radius * 0.160)    # how deep the tip extends toward center
-
-        for i in range(chevron_count):
-            angle = math.radians(-90 + i * (360 / chevron_count))
 
-            # Radial unit vector (outward from gate center toward chevron).
-            rdx = math.cos(angle)
-            rdy = math.sin(angle)
-            # Perpendicular / tangential unit vector.
-            pdx = -rdy
-            pdy = rdx
-
-            # Base centre of the chevron on the gate outer ring.
-            bx = cx + rdx * radius
-            by = cy + rdy * radius
+        # Resting chevron shapes only depend on the gate geometry.
+        if self._chevron_polys_key != (center, radius):
+            self._chevron_polys = [self._chevron_polygons(center, radius, i, 0.0) for i in range(chevron_count)]
+            self._chevron_polys_key = (center, radius)
 
+        for i in range(chevron_count):
             # Plunge animation: the chevron that is about to lock moves inward.
             if i == actuating_pos and actuate_blend > 0.0:
-                plunge = 15.0 * actuate_blend
-                bx -= rdx * plunge
-                by -= rdy * plunge
-
-            # Build the arrowhead polygon pointing toward gate centre.
-            tip_x = bx - rdx * depth
-            tip_y = by - rdy * depth
-            # Two base corners, slightly offset outward so the base doesn't clip the ring.
-            bl_x = bx - pdx * half_w + rdx * 5
-            bl_y = by - pdy * half_w + rdy * 5
-            br_x = bx + pdx * half_w + rdx * 5
-            br_y = by + pdy * half_w + rdy * 5
-
-            points = [(int(tip_x), int(tip_y)), (int(bl_x), int(bl_y)), (int(br_x), int(br_y))]
+                points, shadow_pts, inner, tip = self._chevron_polygons(center, radius, i, 15.0 * actuate_blend)
+            else:
+                points, shadow_pts, inner, tip = self._chevron_polys[i]
 
             lit = i in locked_positions
             is_actuating = (i == actuating_pos and actuate_blend > 0.08)
 
             # Drop shadow.
-            shadow_pts = [(px + 2, py + 3) for px, py in points]
             pygame.draw.polygon(target, (12, 10, 8), shadow_pts)
 
             # Chevron body.
@@ -1910,20 +2737,78 @@ class StargateApp:
 
             if lit or is_actuating:
                 # Inner bright highlight — a smaller similar triangle.
-                inset = 0.44
-                ibl_x = tip_x + (bl_x - tip_x) * inset
-                ibl_y = tip_y + (bl_y - tip_y) * inset
-                ibr_x = tip_x + (br_x - tip_x) * inset
-                ibr_y = tip_y + (br_y - tip_y) * inset
-                inner = [(int(tip_x + rdx * (-2)), int(tip_y + rdy * (-2))), (int(ibl_x), int(ibl_y)), (int(ibr_x), int(ibr_y))]
                 pygame.draw.polygon(target, (255, 210, 130), inner)
 
                 # Glow halo.
-                glow_surf = pygame.Surface(target.get_size(), pygame.SRCALPHA)
-                glow_a = int(110 * (0.7 + 0.3 * actuate_blend)) if is_actuating else 80
-                pygame.draw.circle(glow_surf, (255, 168, 62, glow_a), (int(tip_x), int(tip_y)), half_w + 4)
-                pygame.draw.circle(glow_surf, (255, 210, 130, glow_a // 2), (int(tip_x), int(tip_y)), half_w + 10)
-                target.blit(glow_surf, (0, 0))
+                glow_step = int(actuate_blend * CHEVRON_GLOW_LEVELS) / CHEVRON_GLOW_LEVELS
+                glow_a = int(110 * (0.7 + 0.3 * glow_step)) if is_actuating else 80
+                glow_surf = self._chevron_glow(half_w, glow_a)
+                target.blit(glow_surf, (tip[0] - half_w - 10, tip[1] - half_w - 10))
+
+    def _inner_glow_ring(self, inner_radius: int, spread: int) -> pygame.Surface:
+        """Banded blue glow just outside the gate opening, cached per spread at full pulse strength."""
+        key = (inner_radius, spread)
+        ring = self._inner_glow_cache.get(key)
+        if ring is None:
+            outer = inner_radius + spread
+            ring = pygame.Surface((outer * 2 + 1, outer * 2 + 1), pygame.SRCALPHA)
+            for gl in range(spread, 0, -2):
+                a = int(60 * (1.0 - gl / spread))
+                pygame.draw.circle(ring, (28, 108, 230, a), (outer, outer), inner_radius + gl, 2)
+            ring = ring.convert_alpha()
+            self._inner_glow_cache[key] = ring
+        return ring
+
+    def _chevron_glow(self, half_w: int, alpha: int) -> pygame.Surface:
+        """Tip glow sprite for a lit chevron, cached by size and strength."""
+        key = (half_w, alpha)
+        glow = self._chevron_glow_cache.get(key)
+        if glow is None:
+            outer = half_w + 10
+            glow = pygame.Surface((outer * 2 + 1, outer * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(glow, (255, 168, 62, alpha), (outer, outer), half_w + 4)
+            pygame.draw.circle(glow, (255, 210, 130, alpha // 2), (outer, outer), outer)
+            glow = glow.convert_alpha()
+            self._chevron_glow_cache[key] = glow
+        return glow
+
+    def _chevron_polygons(
+        self, center: Tuple[int, int], radius: int, index: int, plunge: float
+    ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]], List[Tuple[int, int]], Tuple[int, int]]:
+        """Body, shadow and highlight polygons plus tip point for one chevron."""
+        cx, cy = center
+        half_w = int(radius * 0.118)   # half-width of chevron base
+        depth = int(radius * 0.160)    # how deep the tip extends toward center
+        # Radial unit vector (outward from gate center toward chevron).
+        rdx, rdy = CHEVRON_DIRECTIONS[index]
+        # Perpendicular / tangential unit vector.
+        pdx = -rdy
+        pdy = rdx
+
+        # Base centre of the chevron on the gate outer ring, pulled inward while plunging.
+        bx = cx + rdx * radius - rdx * plunge
+        by = cy + rdy * radius - rdy * plunge
+
+        # Build the arrowhead polygon pointing toward gate centre.
+        tip_x = bx - rdx * depth
+        tip_y = by - rdy * depth
+        # Two base corners, slightly offset outward so the base doesn't clip the ring.
+        bl_x = bx - pdx * half_w + rdx * 5
+        bl_y = by - pdy * half_w + rdy * 5
+        br_x = bx + pdx * half_w + rdx * 5
+        br_y = by + pdy * half_w + rdy * 5
+
+        points = [(int(tip_x), int(tip_y)), (int(bl_x), int(bl_y)), (int(br_x), int(br_y))]
+        shadow_pts = [(px + 2, py + 3) for px, py in points]
+
+        # Inner bright highlight — a smaller similar triangle.
+        inset = 0.44
+        ibl_x = tip_x + (bl_x - tip_x) * inset
+        ibl_y = tip_y + (bl_y - tip_y) * inset
+        ibr_x = tip_x + (br_x - tip_x) * inset
+        ibr_y = tip_y + (br_y - tip_y) * inset
+        inner = [(int(tip_x + rdx * (-2)), int(tip_y + rdy * (-2))), (int(ibl_x), int(ibl_y)), (int(ibr_x), int(ibr_y))]
+        return points, shadow_pts, inner, (int(tip_x), int(tip_y))
 
     def _draw_wormhole(self, target: pygame.Surface, center: Tuple[int, int], radius: int, now: float) -> None:
         cx, cy = center
@@ -1945,10 +2830,11 @@ class StargateApp:
                 ring_w = max(3, int(burst_r * 0.14))
                 pygame.draw.circle(target, (255, 255, 255), (cx, cy), burst_r, ring_w)
                 # Outer halo.
-                halo = pygame.Surface(target.get_size(), pygame.SRCALPHA)
+                halo_r = burst_r + int(radius * 0.18)
+                halo = pygame.Surface((halo_r * 2 + 2, halo_r * 2 + 2), pygame.SRCALPHA)
                 halo_a = int(90 * (1.0 - ease))
-                pygame.draw.circle(halo, (140, 210, 255, halo_a), (cx, cy), burst_r + int(radius * 0.18))
-                target.blit(halo, (0, 0))
+                pygame.draw.circle(halo, (140, 210, 255, halo_a), (halo_r + 1, halo_r + 1), halo_r)
+                target.blit(halo, (cx - halo_r - 1, cy - halo_r - 1))
             else:
                 # Contracting / settling: burst pulls back into the event horizon.
                 ease = (t - 0.38) / 0.62
@@ -1978,21 +2864,19 @@ class StargateApp:
         petal_count = 12
         # angle: 0 = open, 1 = fully closed.
         rotation_deg = angle * 75.0  # petals rotate 75° to close
-        # Draw petals from outer edge inward.
+        # Each petal: a wedge from a 28-degree arc on the outer rim to a tip opposite it.
+        # All petal vertices are computed in one batch, then drawn from outer edge inward.
+        base_a = np.radians(np.arange(petal_count) * (360 / petal_count) + rotation_deg)
+        arc_a = base_a[:, None] + IRIS_ARC_OFFSETS
+        arc_x = (cx + np.cos(arc_a) * radius).astype(np.int32).tolist()
+        arc_y = (cy + np.sin(arc_a) * radius).astype(np.int32).tolist()
+        inner_r = max(1, int(radius * (1.0 - angle) * 0.92))
+        tip_a = base_a + math.pi
+        tip_x = (cx + np.cos(tip_a) * inner_r).astype(np.int32).tolist()
+        tip_y = (cy + np.sin(tip_a) * inner_r).astype(np.int32).tolist()
         for i in range(petal_count):
-            base_a = math.radians(i * (360 / petal_count) + rotation_deg)
-            # Each petal: a wedge from the outer rim to the centre.
-            outer_a1 = base_a - math.radians(14)
-            outer_a2 = base_a + math.radians(14)
-            inner_r = max(1, int(radius * (1.0 - angle) * 0.92))
-            pts = []
-            # Outer arc.
-            for step in range(6):
-                a = outer_a1 + (outer_a2 - outer_a1) * step / 5
-                pts.append((int(cx + math.cos(a) * radius), int(cy + math.sin(a) * radius)))
-            # Tip.
-            tip_a = (outer_a1 + outer_a2) / 2 + math.radians(180)
-            pts.append((int(cx + math.cos(tip_a) * inner_r), int(cy + math.sin(tip_a) * inner_r)))
+            pts = list(zip(arc_x[i], arc_y[i]))
+            pts.append((tip_x[i], tip_y[i]))
 
             shade = int(130 + 80 * (i % 2))
             pygame.draw.polygon(target, (shade, shade + 10, shade + 20), pts)
@@ -2006,9 +2890,22 @@ class StargateApp:
         # IDC prompt text drawn on the iris when fully closed.
         if angle > 0.90 and self.idc_mode:
             idc_display = "IDC: " + self.idc_entered + "_" * (3 - len(self.idc_entered))
-            idc_surf = self.font_md.render(idc_display, True, (255, 220, 100))
+            idc_surf = self._text(self.font_md, idc_display, (255, 220, 100))
             target.blit(idc_surf, idc_surf.get_rect(center=(cx, cy)))
 
+    def _render_horizon_disc(self, radius: int) -> pygame.Surface:
+        """Render the opaque event-horizon radial gradient onto a transparent square."""
+        disc = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+        center = (radius + 1, radius + 1)
+        step = 3
+        for r in range(radius, 0, -step):
+            blend = r / radius  # 1 at edge, 0 at centre
+            rr = int(10 + 28 * blend)
+            gg = int(148 + 44 * blend)
+            bb = int(205 + 45 * (1.0 - blend * 0.15))
+            pygame.draw.circle(disc, (rr, gg, bb), center, r)
+        return disc.convert_alpha()
+
     def _draw_event_horizon(
         self, target: pygame.Surface, center: Tuple[int, int], radius: int, now: float, alpha: int = 255
     ) -> None:
@@ -2016,45 +2913,44 @@ class StargateApp:
         cx, cy = center
 
         # Radial gradient: lighter teal centre, darker deep-blue edge.
-        step = 3
-        for r in range(radius, 0, -step):
-            blend = r / radius  # 1 at edge, 0 at centre
-            rr = int(10 + 28 * blend)
-            gg = int(148 + 44 * blend)
-            bb = int(205 + 45 * (1.0 - blend * 0.15))
-            if alpha < 255:
-                surf = pygame.Surface((r * 2 + 2, r * 2 + 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, (rr, gg, bb, alpha), (r + 1, r + 1), r)
-                target.blit(surf, (cx - r - 1, cy - r - 1))
-            else:
-                pygame.draw.circle(target, (rr, gg, bb), (cx, cy), r)
+        if alpha < 255:
+            if alpha > 0:
+                target.blit(self._horizon_fade_layer(radius, alpha), (cx - radius - 1, cy - radius - 1))
+        else:
+            # The opaque gradient never changes for a given radius, so render it once.
+            if self._horizon_disc is None or self._horizon_disc_radius != radius:
+                self._horizon_disc = self._render_horizon_disc(radius)
+                self._horizon_disc_radius = radius
+                self._spec_sprites.clear()
+            target.blit(self._horizon_disc, (cx - radius - 1, cy - radius - 1))
 
         if alpha < 200:
             return
 
-        overlay = pygame.Surface(target.get_size(), pygame.SRCALPHA)
+        # Ripples and shimmer stay inside the horizon, so the overlay only needs its bounding square.
+        overlay = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+        ox, oy = radius + 1, radius + 1
 
         # Animated concentric ripple rings expanding from centre.
-        for i in range(6):
-            phase = (now * 0.55 + i / 6.0) % 1.0
-            r = int(radius * 0.97 * phase)
-            if r < 4:
-                continue
-            fade = 1.0 - phase
-            ring_alpha = int(95 * fade * (0.55 + 0.45 * math.sin(now * 1.7 + i * 1.1)))
-            rw = max(1, int(radius * 0.028))
-            pygame.draw.circle(overlay, (165, 228, 255, ring_alpha), (cx, cy), r, rw)
+        ripple_i = np.arange(6)
+        phase = (now * 0.55 + ripple_i / 6.0) % 1.0
+        ring_r = (radius * 0.97 * phase).astype(np.int32).tolist()
+        ring_alpha = (95 * (1.0 - phase) * (0.55 + 0.45 * np.sin(now * 1.7 + ripple_i * 1.1))).astype(np.int32).tolist()
+        rw = max(1, int(radius * 0.028))
+        for r, a in zip(ring_r, ring_alpha):
+            if r >= 4:
+                pygame.draw.circle(overlay, (165, 228, 255, a), (ox, oy), r, rw)
 
         # Rotating arc shimmer (light playing on the water surface).
-        for i in range(5):
-            base_a = math.radians(now * 48 + i * 72)
-            span = math.radians(28 + 14 * math.sin(now * 0.6 + i))
-            arc_r = int(radius * (0.28 + 0.48 * ((i % 3) / 2.0)))
-            if arc_r > 5:
-                rect = pygame.Rect(cx - arc_r, cy - arc_r, arc_r * 2, arc_r * 2)
-                pygame.draw.arc(overlay, (200, 242, 255, 38), rect, base_a, base_a + span, 2)
+        arc_i = np.arange(5)
+        base_a = np.radians(now * 48 + arc_i * 72)
+        end_a = (base_a + np.radians(28 + 14 * np.sin(now * 0.6 + arc_i))).tolist()
+        arc_r = (radius * (0.28 + 0.48 * ((arc_i % 3) / 2.0))).astype(np.int32).tolist()
+        for start, end, r in zip(base_a.tolist(), end_a, arc_r):
+            if r > 5:
+                pygame.draw.arc(overlay, (200, 242, 255, 38), pygame.Rect(ox - r, oy - r, r * 2, r * 2), start, end, 2)
 
-        target.blit(overlay, (0, 0))
+        target.blit(overlay, (cx - ox, cy - oy))
 
         # Bright vortex core.
         core_pulse = 0.5 + 0.5 * math.sin(now * 3.1)
@@ -2063,59 +2959,207 @@ class StargateApp:
         pygame.draw.circle(target, (240, 252, 255), (cx, cy), max(1, core_r // 2))
 
         # Off-centre specular highlight (upper-left, like a light source above the gate).
-        spec_surf = pygame.Surface(target.get_size(), pygame.SRCALPHA)
         spec_pulse = 0.45 + 0.55 * (0.5 + 0.5 * math.sin(now * 1.05 + 0.8))
         spec_x = cx - int(radius * 0.21)
         spec_y = cy - int(radius * 0.26)
         spec_r = max(3, int(radius * 0.20 * spec_pulse))
-        pygame.draw.circle(spec_surf, (255, 255, 255, 30), (spec_x, spec_y), spec_r)
-        target.blit(spec_surf, (0, 0))
+        spec_surf = self._spec_sprites.get(spec_r)
+        if spec_surf is None:
+            spec_surf = pygame.Surface((spec_r * 2 + 2, spec_r * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(spec_surf, (255, 255, 255, 30), (spec_r + 1, spec_r + 1), spec_r)
+            spec_surf = self._spec_sprites[spec_r] = spec_surf.convert_alpha()
+        target.blit(spec_surf, (spec_x - spec_r - 1, spec_y - spec_r - 1))
+
+    def _horizon_fade_layer(self, radius: int, alpha: int) -> pygame.Surface:
+        """The fading-in horizon gradient (nested discs every 3 px at the given alpha) as one layer."""
+        if self._fade_radius != radius:
+            size = radius * 2 + 2
+            radii = np.arange(radius, 0, -3)
+            blend = radii / radius  # 1 at edge, 0 at centre
+            self._fade_colors = np.stack(
+                [
+                    (10 + 28 * blend).astype(np.int32),
+                    (148 + 44 * blend).astype(np.int32),
+                    (205 + 45 * (1.0 - blend * 0.15)).astype(np.int32),
+                ],
+                axis=1,
+            ).astype(np.float64)
+            # The discs are nested, so painting disc j with value j + 1 (largest first) leaves
+            # every pixel holding the number of discs that cover it.
+            counts = pygame.Surface((size, size))
+            for j, r in enumerate(radii.tolist()):
+                pygame.draw.circle(counts, (j + 1, 0, 0), (radius + 1, radius + 1), r)
+            self._fade_counts = pygame.surfarray.array_red(counts)
+            # depth[k, j]: discs drawn over disc j when k discs cover a pixel (negative if j is absent).
+            self._fade_depth = np.arange(len(radii) + 1)[:, None] - 1 - np.arange(len(radii))[None, :]
+            self._fade_layer = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+            self._fade_radius = radius
+
+        # Alpha-composite the first k discs for every k, then look each pixel up by its count.
+        # Disc j seen under the k - 1 - j discs above it keeps weight a * (1 - a) ** (k - 1 - j).
+        a = alpha / 255.0
+        colors = self._fade_colors
+        depth = self._fade_depth
+        premult = np.where(depth >= 0, a * (1.0 - a) ** np.maximum(depth, 0), 0.0) @ colors
+        coverage = 1.0 - (1.0 - a) ** np.arange(len(colors) + 1)
+        rgb = np.zeros_like(premult)
+        rgb[1:] = premult[1:] / coverage[1:, None]
+        layer = self._fade_layer
+        pixels = pygame.surfarray.pixels3d(layer)
+        pixels[...] = rgb.astype(np.uint8)[self._fade_counts]
+        del pixels
+        alphas = pygame.surfarray.pixels_alpha(layer)
+        alphas[...] = (coverage * 255.0 + 0.5).astype(np.uint8)[self._fade_counts]
+        del alphas
+        return layer
+
+    def _render_glyph_line(self, max_width: int) -> pygame.Surface:
+        """Render the entered address in the glyph font, falling back to numbers when too wide."""
+        numbers = " ".join(f"{i + 1:02d}" for i in self.entered_symbols)
+        surface = self._render_text_safe(
+            self.glyph_font_md,
+            "".join(self.glyph_chars[i] for i in self.entered_symbols),
+            (255, 222, 183),
+            fallback_text=numbers,
+            fallback_font=self.font_md,
+        )
+        if surface.get_width() > max_width:
+            surface = self._text(self.font_md, self._truncate_text(self.font_md, numbers, max_width), (255, 222, 183))
+        return surface
 
     def _draw_console(self, now: float) -> None:
         panel_rect = self.panel_rect
-        panel_shadow = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        pad_x = panel_rect.left + 26
+        content_w = panel_rect.right - 26 - pad_x
+        preset_top = self.preset_buttons[0].rect.top if self.preset_buttons else panel_rect.bottom
+        dhd_top = self.dhd.center[1] - self.dhd.outer_radius
+        info_bottom = min(preset_top - 10, dhd_top - 12)
+
+        # Everything beneath the DHD (panel chrome, readouts and the preset row) only changes on
+        # input or a state change, so it is painted into a cached layer and repainted when dirty.
+        hovered_preset = self.hovered_button if self.hovered_button in self.preset_buttons else None
+        console_key = (
+            tuple(panel_rect),
+            info_bottom,
+            tuple(self.current_address) if self.state == "CONNECTED" else None,
+            self._glyph_string,
+            self._index_text,
+            self.status,
+            self.hovered_symbol,
+            hovered_preset,
+        )
+        if console_key != self._console_key:
+            previous = self._console_key
+            self._console_key = console_key
+            if previous is not None and previous[:5] + previous[6:] == console_key[:5] + console_key[6:]:
+                # Only the status changed (the CONNECTED timer does so ten times a second):
+                # repaint just the band from the status line down to the preset row.
+                band = pygame.Rect(0, self._console_status_top, self._console_layer.get_width(), 0)
+                band.height = max(0, info_bottom - self._console_origin[1] - band.top)
+                self._paint_console_layer(content_w, info_bottom, hovered_preset, band)
+                if self._present_rects is not None:
+                    self._present_rects.append(band.move(self._console_origin))
+            else:
+                self._paint_console_layer(content_w, info_bottom, hovered_preset)
+                self._present_rects = None
+        self.screen.blit(self._console_layer, self._console_origin)
+
+        connected = self.state == "CONNECTED"
+        pulse = 0.5 + 0.5 * math.sin(now * 2.8)
+        dhd_changed = self.dhd.draw(
+            self.screen,
+            hovered_symbol=self.hovered_symbol,
+            symbol_stage=self._symbol_stage,
+            pulse=pulse,
+            connected=connected,
+        )
+        if dhd_changed is not None and self._present_rects is not None:
+            self._present_rects.append(dhd_changed)
+        self._draw_dhd_ripples(now)
+
+        self.screen.blits(
+            [
+                (
+                    self._pill(
+                        btn,
+                        (124, 74, 43) if btn is self.hovered_button else (89, 56, 34),
+                        (255, 226, 194),
+                        hover=btn is self.hovered_button,
+                    ),
+                    btn.rect.topleft,
+                )
+                for btn in self.controls
+            ],
+            doreturn=False,
+        )
+
+        # The key hints only move with the layout, so their blit list is kept between frames.
+        hint_bottom = self.controls[0].rect.top - 8 if self.controls else panel_rect.bottom - 8
+        hint_key = (pad_x, content_w, info_bottom, hint_bottom)
+        if hint_key != self._hint_key:
+            self._hint_key = hint_key
+            self._hint_blits = []
+            hint_line_h = self.font_sm.get_height() + 2
+            y = max(info_bottom + 8, hint_bottom - len(CONSOLE_HINTS) * hint_line_h)
+            for line in CONSOLE_HINTS:
+                if y + hint_line_h > hint_bottom:
+                    break
+                line_text = self._truncate_text(self.font_sm, line, content_w)
+                self._hint_blits.append((self._text(self.font_sm, line_text, (145, 164, 188)), (pad_x, y)))
+                y += hint_line_h
+        self.screen.blits(self._hint_blits, doreturn=False)
+
+    def _paint_console_layer(
+        self, content_w: int, info_bottom: int, hovered_preset: Optional[Button], clip: Optional[pygame.Rect] = None
+    ) -> None:
+        """Redraw the panel chrome, readouts and preset row into the cached console layer, limited to clip."""
+        gloss_rect = self.panel_rect.inflate(-16, -20)
+        gloss_bounds = gloss_rect.union(gloss_rect.move(0, 16))
+        bounds = self.panel_rect.union(self.panel_rect.move(7, 8)).union(gloss_bounds)
+        layer = self._console_layer
+        if layer is None or layer.get_size() != bounds.size:
+            layer = self._console_layer = pygame.Surface(bounds.size, pygame.SRCALPHA).convert_alpha()
+        else:
+            layer.set_clip(clip)
+            layer.fill((0, 0, 0, 0))
+        self._console_origin = bounds.topleft
+        ox, oy = bounds.topleft
+        # Everything below is drawn in layer coordinates.
+        panel_rect = self.panel_rect.move(-ox, -oy)
+        info_bottom -= oy
         pygame.draw.rect(
-            panel_shadow,
+            layer,
             (0, 0, 0, 140),
             panel_rect.move(7, 8),
             border_radius=20,
         )
-        self.screen.blit(panel_shadow, (0, 0))
-        pygame.draw.rect(self.screen, (13, 17, 23), panel_rect, border_radius=18)
-        pygame.draw.rect(self.screen, (43, 56, 74), panel_rect, width=2, border_radius=18)
-        pygame.draw.rect(self.screen, (20, 27, 35), panel_rect.inflate(-8, -8), border_radius=16)
-        gloss = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        gloss_rect = panel_rect.inflate(-16, -20)
+        pygame.draw.rect(layer, (13, 17, 23), panel_rect, border_radius=18)
+        pygame.draw.rect(layer, (43, 56, 74), panel_rect, width=2, border_radius=18)
+        pygame.draw.rect(layer, (20, 27, 35), panel_rect.inflate(-8, -8), border_radius=16)
+        gloss = pygame.Surface(gloss_bounds.size, pygame.SRCALPHA)
+        gloss_rect.move_ip(-gloss_bounds.x, -gloss_bounds.y)
         pygame.draw.rect(gloss, (255, 255, 255, 18), gloss_rect, border_radius=14)
         pygame.draw.rect(gloss, (0, 0, 0, 40), gloss_rect.move(0, 16), border_radius=14)
-        self.screen.blit(gloss, (0, 0))
+        layer.blit(gloss, (gloss_bounds.x - ox, gloss_bounds.y - oy))
 
         pad_x = panel_rect.left + 26
-        panel_right = panel_rect.right - 26
-        content_w = panel_right - pad_x
-        preset_top = self.preset_buttons[0].rect.top if self.preset_buttons else panel_rect.bottom
-        dhd_top = self.dhd.center[1] - self.dhd.outer_radius
-        info_bottom = min(preset_top - 10, dhd_top - 12)
 
         title_y = panel_rect.top + 18
-        title = self.font_lg.render("STARGATE COMMAND", True, (215, 227, 245))
-        subtitle = self.font_sm.render("Dialing Computer + DHD", True, (148, 170, 198))
-        self.screen.blit(title, (pad_x, title_y))
-        self.screen.blit(subtitle, (pad_x + 2, title_y + 40))
+        title = self._text(self.font_lg, "STARGATE COMMAND", (215, 227, 245))
+        subtitle = self._text(self.font_sm, "Dialing Computer + DHD", (148, 170, 198))
+        layer.blit(title, (pad_x, title_y))
+        layer.blit(subtitle, (pad_x + 2, title_y + 40))
 
         y = title_y + 72
         # Destination info panel — shown when connected to a known address.
         if self.state == "CONNECTED" and y < info_bottom:
-            dest_name = next(
-                (name for name, addr in KNOWN_ADDRESSES.items() if addr == self.current_address),
-                None,
-            )
+            dest_name = KNOWN_ADDRESS_NAMES.get(tuple(self.current_address))
             info = DESTINATION_INFO.get(dest_name or "", {})
             if dest_name and info:
                 # Coloured header bar.
                 header_text = f"DESTINATION: {dest_name.upper()}"
-                header_surf = self.font_md.render(header_text, True, (80, 220, 120))
-                self.screen.blit(header_surf, (pad_x, y))
+                header_surf = self._text(self.font_md, header_text, (80, 220, 120))
+                layer.blit(header_surf, (pad_x, y))
                 y += header_surf.get_height() + 4
                 for key, val in info.items():
                     if y >= info_bottom:
@@ -2124,66 +3168,56 @@ class StargateApp:
                     label_col = (148, 170, 198)
                     line = self._truncate_text(self.font_sm, f"{key.upper()}: {val}", content_w)
                     col = threat_color if key == "threat" else label_col
-                    self.screen.blit(self.font_sm.render(line, True, col), (pad_x, y))
+                    layer.blit(self._text(self.font_sm, line, col), (pad_x, y))
                     y += self.font_sm.get_height() + 2
                 y += 6
 
         if y < info_bottom:
-            self.screen.blit(
-                self.font_md.render("Address Glyphs:", True, (255, 208, 148)),
+            layer.blit(
+                self._text(self.font_md, "Address Glyphs:", (255, 208, 148)),
                 (pad_x, y),
             )
             y += self.font_md.get_height() + 2
 
-        glyph_string = "".join(self.glyph_chars[i] for i in self.entered_symbols)
         if y < info_bottom:
-            if glyph_string:
-                glyph_surface = self._render_text_safe(
-                    self.glyph_font_md,
-                    glyph_string,
-                    (255, 222, 183),
-                    fallback_text=" ".join(f"{i + 1:02d}" for i in self.entered_symbols),
-                    fallback_font=self.font_md,
-                )
-                if glyph_surface.get_width() > content_w:
-                    glyph_fallback = self._truncate_text(
-                        self.font_md,
-                        " ".join(f"{i + 1:02d}" for i in self.entered_symbols),
-                        content_w,
-                    )
-                    glyph_surface = self.font_md.render(glyph_fallback, True, (255, 222, 183))
-                self.screen.blit(glyph_surface, (pad_x, y))
+            if self._glyph_string:
+                glyph_key = (self._glyph_string, content_w)
+                if self._glyph_line_key != glyph_key:
+                    self._glyph_line_surface = self._render_glyph_line(content_w)
+                    self._glyph_line_key = glyph_key
+                glyph_surface = self._glyph_line_surface
+                layer.blit(glyph_surface, (pad_x, y))
                 y += glyph_surface.get_height() + 6
             else:
-                empty_surface = self.font_sm.render("<empty>", True, (166, 185, 206))
-                self.screen.blit(empty_surface, (pad_x, y + 2))
+                empty_surface = self._text(self.font_sm, "<empty>", (166, 185, 206))
+                layer.blit(empty_surface, (pad_x, y + 2))
                 y += empty_surface.get_height() + 6
 
-        parts = []
-        for pos, sym in enumerate(self.entered_symbols):
-            tag = f"{sym + 1:02d}"
-            if pos == len(self.entered_symbols) - 1:
-                tag += "(PoO)"
-            parts.append(tag)
-        index_text = " ".join(parts) if parts else "-"
-        index_line = self._truncate_text(self.font_sm, f"Glyphs: {index_text}", content_w)
+        index_line = self._truncate_text(self.font_sm, self._index_text, content_w)
         if y < info_bottom:
-            self.screen.blit(
-                self.font_sm.render(index_line, True, (166, 185, 206)),
+            layer.blit(
+                self._text(self.font_sm, index_line, (166, 185, 206)),
                 (pad_x, y),
             )
             y += self.font_sm.get_height() + 4
 
-        status_lines = self._wrap_text(
-            self.font_sm,
-            f"Status: {self.status}",
-            content_w,
-            max_lines=2,
-        )
-        for line in status_lines:
+        self._console_status_top = y
+        # Re-wrap and re-render the status only when its text or width changes.
+        if self._status_key != (self.status, content_w):
+            status_lines = self._wrap_text(
+                self.font_sm,
+                f"Status: {self.status}",
+                content_w,
+                max_lines=2,
+            )
+            self._status_surfaces = [
+                self.font_sm.render(line, True, (170, 190, 214)).convert_alpha() for line in status_lines
+            ]
+            self._status_key = (self.status, content_w)
+        for status_surface in self._status_surfaces:
             if y + self.font_sm.get_height() > info_bottom:
                 break
-            self.screen.blit(self.font_sm.render(line, True, (170, 190, 214)), (pad_x, y))
+            layer.blit(status_surface, (pad_x, y))
             y += self.font_sm.get_height() + 2
 
         if self.hovered_symbol is not None and y + self.font_sm.get_height() <= info_bottom:
@@ -2192,73 +3226,61 @@ class StargateApp:
                 f"Hovered symbol: {self.hovered_symbol + 1:02d}",
                 content_w,
             )
-            self.screen.blit(self.font_sm.render(hover_line, True, (248, 205, 147)), (pad_x, y))
+            layer.blit(self._text(self.font_sm, hover_line, (248, 205, 147)), (pad_x, y))
             y += self.font_sm.get_height() + 2
 
-        for btn in self.preset_buttons:
-            if btn.action == "random":
-                self._draw_pill(btn, (80, 55, 18), (255, 210, 120), hover=btn.rect.collidepoint(pygame.mouse.get_pos()))
-            else:
-                self._draw_pill(btn, (43, 72, 106), (214, 233, 255), hover=btn.rect.collidepoint(pygame.mouse.get_pos()))
-
-        symbol_stage: Dict[int, int] = {}
-        for sym in self.entered_symbols:
-            symbol_stage[sym] = max(symbol_stage.get(sym, 0), 1)
-        for i, sym in enumerate(self.current_address):
-            if i < self.locked_count:
-                symbol_stage[sym] = 2
-
-        connected = self.state == "CONNECTED"
-        pulse = 0.5 + 0.5 * math.sin(now * 2.8)
-        self.dhd.draw(
-            self.screen,
-            hovered_symbol=self.hovered_symbol,
-            symbol_stage=symbol_stage,
-            pulse=pulse,
-            connected=connected,
+        layer.blits(
+            [
+                (
+                    self._pill(btn, (80, 55, 18), (255, 210, 120), hover=btn is hovered_preset)
+                    if btn.action == "random"
+                    else self._pill(btn, (43, 72, 106), (214, 233, 255), hover=btn is hovered_preset),
+                    btn.rect.move(-ox, -oy).topleft,
+                )
+                for btn in self.preset_buttons
+            ],
+            doreturn=False,
         )
-        self._draw_dhd_ripples(now)
+        layer.set_clip(None)
 
-        for btn in self.controls:
-            hover = btn.rect.collidepoint(pygame.mouse.get_pos())
-            fill = (89, 56, 34) if not hover else (124, 74, 43)
-            text = (255, 226, 194)
-            self._draw_pill(btn, fill, text, hover=hover)
-
-        hints = [
-            "Center = DIAL  |  I: Iris  |  Tab: Dial Log",
-            "1-9: symbols  |  F1-F4: presets  |  IDC code: 314",
-            "Enter: DIAL | Backspace: BACK | Del: CLEAR | Esc: CLOSE",
-        ]
-        hint_line_h = self.font_sm.get_height() + 2
-        hints_total_h = len(hints) * hint_line_h
-        hint_bottom = self.controls[0].rect.top - 8 if self.controls else panel_rect.bottom - 8
-        y = max(info_bottom + 8, hint_bottom - hints_total_h)
-        for line in hints:
-            if y + hint_line_h > hint_bottom:
-                break
-            line_text = self._truncate_text(self.font_sm, line, content_w)
-            text = self.font_sm.render(line_text, True, (145, 164, 188))
-            self.screen.blit(text, (pad_x, y))
-            y += hint_line_h
-
-    def _draw_pill(
+    def _pill(
         self,
         btn: Button,
         fill: Tuple[int, int, int],
         text_color: Tuple[int, int, int],
         hover: bool,
-    ) -> None:
+    ) -> pygame.Surface:
+        """Cached pill surface for a button in the given state; blitted in one batch per row."""
+        key = (btn.rect.size, btn.label, fill, text_color, hover)
+        pill = self._pill_cache.get(key)
+        if pill is None:
+            pill = self._render_pill(btn.rect.size, btn.label, fill, text_color, hover)
+            self._pill_cache[key] = pill
+        return pill
+
+    def _render_pill(
+        self,
+        size: Tuple[int, int],
+        label_text: str,
+        fill: Tuple[int, int, int],
+        text_color: Tuple[int, int, int],
+        hover: bool,
+    ) -> pygame.Surface:
+        """Render a button pill (drop shadow, gloss, border and label) to a reusable surface."""
         border = (29, 34, 41) if not hover else (250, 198, 128)
-        pygame.draw.rect(self.screen, (10, 12, 16), btn.rect.move(2, 2), border_radius=12)
-        pygame.draw.rect(self.screen, fill, btn.rect, border_radius=12)
-        gloss = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        top_gloss = pygame.Rect(btn.rect.left + 2, btn.rect.top + 2, btn.rect.width - 4, max(8, btn.rect.height // 3))
+        width, height = size
+        pill = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA)
+        rect = pygame.Rect(0, 0, width, height)
+        pygame.draw.rect(pill, (10, 12, 16), rect.move(2, 2), border_radius=12)
+        pygame.draw.rect(pill, fill, rect, border_radius=12)
+        gloss = pygame.Surface(pill.get_size(), pygame.SRCALPHA)
+        top_gloss = pygame.Rect(2, 2, width - 4, max(8, height // 3))
         pygame.draw.rect(gloss, (255, 255, 255, 26), top_gloss, border_radius=10)
-        self.screen.blit(gloss, (0, 0))
-        pygame.draw.rect(self.screen, border, btn.rect, width=2, border_radius=12)
-        label = self.font_sm.render(btn.label, True, text_color)
-        self.screen.blit(label, label.get_rect(center=btn.rect.center))
+        pill.blit(gloss, (0, 0))
+        pygame.draw.rect(pill, border, rect, width=2, border_radius=12)
+        label = self.font_sm.render(label_text, True, text_color)
+        pill.blit(label, label.get_rect(center=rect.center))
+        return pill.convert_alpha()
 
 
 def main() -> None: